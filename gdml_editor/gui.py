@@ -15,6 +15,10 @@ Fixes the same sys.modules issue as run_vtkviewer.py.
 
 import sys
 import os
+import bisect
+import functools
+import logging
+import operator
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
@@ -27,12 +31,282 @@ for mod in modules_to_clear:
 # Ensure DISPLAY is set for X11
 os.environ["DISPLAY"] = ":0"
 
+logger = logging.getLogger(__name__)
+
+# Viewer launched by "View in VTK"; it ships next to this module, so look once
+_VIEWER_SCRIPT = Path(__file__).parent / "run_vtkviewer.py"
+_VIEWER_SCRIPT_EXISTS = _VIEWER_SCRIPT.is_file()
+
+
+def _render_gdml(registry):
+    """Return ``registry`` serialised as a GDML document string.
+
+    A Writer accumulates its XML document in ``addDetector`` and cannot be
+    reset, so a fresh one is used per call. Callers that only need the text
+    (e.g. to compare or hand it to another tool) can skip the filesystem.
+    """
+    import pyg4ometry.gdml as gdml
+
+    writer = gdml.Writer()
+    writer.addDetector(registry)
+    return writer.doc.toprettyxml()
+
+
+def _write_gdml(registry, filename, fsync=False):
+    """Write ``registry`` to ``filename`` as GDML.
+
+    The document is rendered with :func:`_render_gdml` and saved with
+    :func:`_write_gdml_text`.
+    """
+    _write_gdml_text(_render_gdml(registry), filename, fsync)
+
+
+def _write_gdml_text(text, filename, fsync=False):
+    """Write the GDML document ``text`` to ``filename``.
+
+    The text goes into ``filename.tmp``, which is moved over ``filename`` with
+    ``os.replace``, so readers (such as the auto-refreshing viewer) never see
+    a half-written file and a failed write leaves the previous version intact.
+    The handle is flushed before closing and, with ``fsync=True``, synced to
+    disk as well. A filename ending in ``.gz`` is written gzip-compressed.
+    No registry is involved, so this is safe to run on a worker thread.
+    """
+    import shutil
+
+    filename = os.fspath(filename)
+    tmp_path = filename + ".tmp"
+    compressed = filename.endswith(".gz")
+    try:
+        with open(tmp_path, "wb" if compressed else "w") as f:
+            if compressed:
+                import gzip
+
+                # Level 1 keeps the CPU cost low; the repetitive XML still shrinks well
+                with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=1) as gz:
+                    gz.write(text.encode("utf-8"))
+            else:
+                f.write(text)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        if os.path.exists(filename):
+            shutil.copymode(filename, tmp_path)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself as well as the file contents
+        dir_fd = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _prewarm_pyg4ometry():
+    """Import the pyg4ometry modules the editor needs, ahead of first use (background thread).
+
+    pyg4ometry's packages import each other circularly, so an import on the
+    Tk thread interleaving with this one can be handed a partially
+    initialized module. The interpreter's import lock is held throughout:
+    imports from other threads wait for the prewarm to finish instead.
+    """
+    import _imp
+
+    _imp.acquire_lock()
+    try:
+        import pyg4ometry.gdml  # noqa: F401
+        import pyg4ometry.geant4  # noqa: F401
+    except Exception as e:
+        # The real import on first use reports the problem to the user
+        logger.debug("pyg4ometry prewarm failed: %s", e)
+    finally:
+        _imp.release_lock()
+
+
+def _read_gdml(filename):
+    """Read ``filename`` (plain or ``.gz`` GDML) and return its registry."""
+    import pyg4ometry.gdml as gdml
+
+    if not str(filename).endswith(".gz"):
+        return gdml.Reader(filename).getRegistry()
+
+    import gzip
+    import shutil
+    import tempfile
+
+    # The Reader only accepts a path; unpack next to the original so that
+    # relative ENTITY includes still resolve. A read-only directory (mounted
+    # share, system data dir) gets the default temp dir instead.
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".gdml", dir=os.path.dirname(os.path.abspath(filename)))
+    except OSError:
+        fd, tmp_path = tempfile.mkstemp(suffix=".gdml")
+    try:
+        with os.fdopen(fd, "wb") as out, gzip.open(filename, "rb") as src:
+            shutil.copyfileobj(src, out)
+        return gdml.Reader(tmp_path).getRegistry()
+    finally:
+        os.unlink(tmp_path)
+
+
+def _eval_placement(pv):
+    """Return a physical volume's evaluated ``(rotation, position)``."""
+    return (pv.rotation.eval() if hasattr(pv.rotation, 'eval') else [0, 0, 0],
+            pv.position.eval() if hasattr(pv.position, 'eval') else [0, 0, 0])
+
+
+def _mesh_to_facets(mesh):
+    """Return ``mesh`` (N triangles x 3 vertices x 3 coords) as ``[vertices, triangles]``.
+
+    STL stores every vertex once per triangle; duplicates are collapsed with
+    ``np.unique``, and each triangle lists the indices of its three vertices.
+    This is the indexed form a ``MeshType.Freecad`` TessellatedSolid keeps.
+    Touches neither Tk nor a registry, so it is safe on a worker thread.
+    """
+    import numpy as np
+
+    verts = np.asarray(mesh, dtype=float).reshape(-1, 3)
+    if not len(verts):
+        return [[], []]
+    unique, inverse = np.unique(verts, axis=0, return_inverse=True)
+    return [unique.tolist(), inverse.reshape(-1, 3).tolist()]
+
+
+# Prefix of the placeholder row that marks a tree item whose daughters are not inserted yet
+_LAZY_CHILD = "__lazy__"
+
+
+# Choices for the Insert Volume dialog; tuples are handed to Tk as-is
+_SHAPE_TYPES = ("Box", "Sphere", "Cylinder", "Cone", "Torus", "Tube", "STEP File", "STL File")
+_LENGTH_UNITS = ("mm", "cm", "m")
+
+# Scale factors to the internal units (mm, g/cm3)
+_UNIT_TO_MM = {'mm': 1.0, 'cm': 10.0, 'm': 1000.0}
+_DENSITY_TO_G_CM3 = {'g/cm3': 1.0, 'mg/cm3': 1e-3, 'kg/m3': 1e-3}
+
+# CSG shapes: dialog name -> (g4.solid constructor, parameter order, takes angles in deg)
+_SHAPE_TABLE = {
+    "Box": ("Box", ("pX", "pY", "pZ"), False),
+    "Sphere": ("Sphere", ("pRMin", "pRMax", "pSPhi", "pDPhi", "pSTheta", "pDTheta"), True),
+    "Cylinder": ("Tubs", ("pRMin", "pRMax", "pDz", "pSPhi", "pDPhi"), True),
+    "Tube": ("Tubs", ("pRMin", "pRMax", "pDz", "pSPhi", "pDPhi"), True),
+    "Cone": ("Cons", ("pRMin1", "pRMax1", "pRMin2", "pRMax2", "pDz", "pSPhi", "pDPhi"), True),
+    "Torus": ("Torus", ("pRMin", "pRMax", "pRTor", "pSPhi", "pDPhi"), True),
+}
+
+# Solid parameters shown in the info panel, by pyg4ometry class name
+_SOLID_FIELDS = {
+    'Box': ('pX', 'pY', 'pZ'),
+    'Tubs': ('pRMin', 'pRMax', 'pDz', 'pSPhi', 'pDPhi'),
+    'Cons': ('pRMin1', 'pRMax1', 'pRMin2', 'pRMax2', 'pDz', 'pSPhi', 'pDPhi'),
+    'Sphere': ('pRMin', 'pRMax', 'pSPhi', 'pDPhi', 'pSTheta', 'pDTheta'),
+    'Torus': ('pRMin', 'pRMax', 'pRTor', 'pSPhi', 'pDPhi'),
+}
+# One C-level getter per class fetching all of its fields at once
+_SOLID_GETTERS = {cls: operator.attrgetter(*fields) for cls, fields in _SOLID_FIELDS.items()}
+
+# Offered when pyg4ometry cannot provide its full NIST list
+_FALLBACK_NIST_MATERIALS = (
+    'G4_AIR', 'G4_Al', 'G4_Cu', 'G4_Fe', 'G4_Pb', 'G4_W',
+    'G4_WATER', 'G4_Galactic', 'G4_CONCRETE', 'G4_PLASTIC_SC_VINYLTOLUENE',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _nist_materials():
+    """Return the NIST/G4 material names, read from pyg4ometry once per process."""
+    try:
+        import pyg4ometry.geant4 as g4
+        return tuple(g4.getNistMaterialList())
+    except Exception as e:
+        logger.warning("Could not get full NIST list: %s", e)
+        return _FALLBACK_NIST_MATERIALS
+
+
+@functools.lru_cache(maxsize=1)
+def _nist_material_set():
+    """Return :func:`_nist_materials` as a frozenset, for membership tests."""
+    return frozenset(_nist_materials())
+
+
+def _resolve_material(registry, material_name):
+    """Return the material ``material_name``, creating NIST/G4 materials on demand.
+
+    Membership is checked up front; raises ``ValueError`` with a user-facing
+    message when the name cannot be used as a material.
+    """
+    import pyg4ometry.geant4 as g4
+
+    obj = registry.materialDict.get(material_name)
+    if obj is not None and not isinstance(obj, g4.Element):
+        return obj
+
+    if material_name.startswith('G4_') and material_name in _nist_material_set():
+        # MaterialPredefined avoids the Material_ prefix and adds itself to the
+        # registry. This also covers G4_Si etc. registered as an Element for
+        # material composition
+        return g4.MaterialPredefined(material_name, registry)
+
+    if obj is not None:
+        raise ValueError(f"'{material_name}' is an element, not a material")
+    raise ValueError(f"Material '{material_name}' not found in registry or NIST list.")
+
+
+# Most names a picker dropdown shows at once; typing narrows the rest
+_MAX_CHOICES = 100
+
+
+def _choice_index(names):
+    """Return a case-insensitive search index over ``names`` for :func:`_match_choices`."""
+    return sorted((name.lower(), name) for name in names)
+
+
+def _sorted_case_insensitive(names):
+    """Return ``names`` sorted case-insensitively, ties broken by the exact name.
+
+    Sorts precomputed ``(lower, name)`` pairs, i.e. the :func:`_choice_index`
+    order, instead of going through a per-element key function.
+    """
+    return [name for _, name in _choice_index(names)]
+
+
+def _match_choices(index, typed, limit=_MAX_CHOICES):
+    """Return up to ``limit`` names from ``index`` that match ``typed``.
+
+    Prefix matches are found by bisecting the sorted index, so a keystroke
+    does not rescan every name; if there are none, fall back to a substring
+    scan so that e.g. "water" still finds G4_WATER.
+    """
+    needle = typed.strip().lower()
+    matches = []
+    for i in range(bisect.bisect_left(index, (needle,)), len(index)):
+        key, name = index[i]
+        if len(matches) == limit or not key.startswith(needle):
+            break
+        matches.append(name)
+    if not matches:
+        matches = [name for key, name in index if needle in key][:limit]
+    return matches
+
 
 class InsertVolumeDialog:
-    def __init__(self, parent, registry, world_lv):
+    # (weakref to registry, material count, sorted tuple, search index) from the last dialog
+    _materials_cache = None
+
+    def __init__(self, parent, registry, world_lv, volume_names=None):
         self.registry = registry
         self.world_lv = world_lv
+        self.volume_names = volume_names
         self.result = None
+        self.parent = parent
+
+        # Probe the registry once for a physical volume dict to back-fill
+        pv_dict = getattr(registry, 'physicalVolumeDict', None)
+        self._pv_dict = pv_dict if isinstance(pv_dict, dict) else None
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Insert New Volume")
@@ -64,7 +338,7 @@ class InsertVolumeDialog:
             shape_frame,
             textvariable=self.shape_type,
             state='readonly',
-            values=["Box", "Sphere", "Cylinder", "Cone", "Torus", "Tube", "STEP File", "STL File"],
+            values=_SHAPE_TYPES,
             width=28,
         )
         shape_combo.pack(side=tk.LEFT, padx=5)
@@ -79,7 +353,7 @@ class InsertVolumeDialog:
             unit_frame,
             textvariable=self.length_unit_var,
             state='readonly',
-            values=["mm", "cm", "m"],
+            values=_LENGTH_UNITS,
             width=10,
         )
         unit_combo.pack(side=tk.LEFT, padx=5)
@@ -91,19 +365,17 @@ class InsertVolumeDialog:
         ttk.Label(mat_frame, text="Material:", width=20).pack(side=tk.LEFT)
         self.material_var = tk.StringVar()
 
-        # Get all available materials: existing + NIST/G4
-        materials = self._get_all_available_materials()
-
+        # Editable so the (long) list can be narrowed by typing; the choices
+        # themselves are filled in by _populate_choices once the dialog is up
+        self._material_index = []
         self.material_combo = ttk.Combobox(
             mat_frame,
             textvariable=self.material_var,
-            values=materials,
-            state='readonly',
+            values=("<loading...>",),
             width=28,
         )
         self.material_combo.pack(side=tk.LEFT, padx=5)
-        if materials:
-            self.material_var.set(materials[0])
+        self.material_combo.bind('<KeyRelease>', self._filter_materials)
 
         # Parent Volume
         parent_frame = ttk.Frame(main_frame)
@@ -111,17 +383,14 @@ class InsertVolumeDialog:
         ttk.Label(parent_frame, text="Parent Volume:", width=20).pack(side=tk.LEFT)
         self.parent_var = tk.StringVar(value=self.world_lv.name)
 
-        # Get available logical volumes
-        volumes = list(self.registry.logicalVolumeDict.keys())
-        volumes.sort()
-
-        ttk.Combobox(
+        self.parent_combo = ttk.Combobox(
             parent_frame,
             textvariable=self.parent_var,
-            values=volumes,
+            values=(self.world_lv.name,),
             state='readonly',
             width=28,
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.parent_combo.pack(side=tk.LEFT, padx=5)
 
         # Separator
         ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
@@ -130,6 +399,9 @@ class InsertVolumeDialog:
         self.params_container = ttk.LabelFrame(main_frame, text="Shape Parameters", padding=10)
         self.params_container.pack(fill=tk.X, pady=5)
 
+        # shape -> (frame, param vars); built on first use, then only re-packed
+        self._param_frames = {}
+        self._shown_params = None
         self.update_parameters_ui()
 
         # Separator
@@ -179,18 +451,47 @@ class InsertVolumeDialog:
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=10)
         ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Insert Volume", command=self.insert_volume).pack(side=tk.RIGHT, padx=5)
+        self.insert_button = ttk.Button(button_frame, text="Insert Volume", command=self.insert_volume)
+        self.insert_button.pack(side=tk.RIGHT, padx=5)
+
+        # Shown only while a STEP/STL file is being read
+        self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
+
+        # Enumerate materials and volumes after the dialog has been drawn
+        self.dialog.after_idle(self._populate_choices)
 
-        # Force update
-        self.dialog.update_idletasks()
+    def _populate_choices(self):
+        """Fill the material and parent volume dropdowns."""
+        materials = self._get_all_available_materials()
+        self._material_index = InsertVolumeDialog._materials_cache[3]
+        self.material_combo['values'] = _match_choices(self._material_index, "")
+        if materials and not self.material_var.get():
+            self.material_var.set(materials[0])
+
+        # The app passes its already sorted name list
+        if self.volume_names is not None:
+            self.parent_combo['values'] = self.volume_names
+        else:
+            self.parent_combo['values'] = sorted(self.registry.logicalVolumeDict)
     
     def update_parameters_ui(self):
         """Update parameter inputs based on selected shape."""
-        # Clear existing widgets
-        for widget in self.params_container.winfo_children():
-            widget.destroy()
-        
         shape = self.shape_type.get()
+        cached = self._param_frames.get(shape)
+        if cached is None:
+            cached = self._param_frames[shape] = self._build_parameters_frame(shape)
+        frame, self.param_vars = cached
+        
+        # Swap frames instead of destroying and recreating the fields
+        if self._shown_params is not frame:
+            if self._shown_params is not None:
+                self._shown_params.pack_forget()
+            frame.pack(fill=tk.X)
+            self._shown_params = frame
+    
+    def _build_parameters_frame(self, shape):
+        """Create the parameter fields for ``shape``; returns (frame, param vars)."""
+        self._params_frame = ttk.Frame(self.params_container)
         self.param_vars = {}
         
         if shape == "Box":
@@ -239,46 +540,50 @@ class InsertVolumeDialog:
         elif shape == "STEP File":
             self.add_file_selector("STEP File (.step, .stp)", "step_file")
             self.add_option_checkbox("Use flat tessellation (single solid)", "use_flat")
-            ttk.Label(self.params_container, text="Note: STEP file will preserve hierarchy\nand convert to CSG where possible",
+            ttk.Label(self._params_frame, text="Note: STEP file will preserve hierarchy\nand convert to CSG where possible",
                      font=('TkDefaultFont', 8, 'italic'), foreground='gray').pack(pady=5)
         
         elif shape == "STL File":
             self.add_file_selector("STL File (.stl)", "stl_file")
             self.add_param_field("Linear deflection (mesh quality)", "lin_def", "0.5")
-            ttk.Label(self.params_container, text="Note: STL will be converted to tessellated solid",
+            ttk.Label(self._params_frame, text="Note: STL will be converted to tessellated solid",
                      font=('TkDefaultFont', 8, 'italic'), foreground='gray').pack(pady=5)
+        
+        return self._params_frame, self.param_vars
     
     def _get_all_available_materials(self):
-        """Get combined list of existing and NIST/G4 materials."""
-        materials = []
-        
-        # Existing materials in registry
-        materials.extend(list(self.registry.materialDict.keys()))
-        
-        # ALL NIST/G4 materials using pyg4ometry's built-in list
-        import pyg4ometry.geant4 as g4
-        try:
-            nist_list = g4.getNistMaterialList()
-            for mat in nist_list:
-                if mat not in materials:
-                    materials.append(mat)
-        except Exception as e:
-            # Fallback to common materials if getNistMaterialList fails
-            print(f"Warning: Could not get full NIST list: {e}")
-            nist_materials = [
-                'G4_AIR', 'G4_Al', 'G4_Cu', 'G4_Fe', 'G4_Pb', 'G4_W',
-                'G4_WATER', 'G4_Galactic', 'G4_CONCRETE', 'G4_PLASTIC_SC_VINYLTOLUENE'
-            ]
-            for mat in nist_materials:
-                if mat not in materials:
-                    materials.append(mat)
-        
-        materials.sort()
+        """Get combined sorted tuple of existing and NIST/G4 materials.
+
+        The tuple and its picker search index are cached across dialog
+        openings and reused without re-sorting; materials are only ever
+        added to a registry, so the cache is valid while the registry object
+        and its material count are unchanged.
+        """
+        import weakref
+
+        cached = InsertVolumeDialog._materials_cache
+        count = len(self.registry.materialDict)
+        if cached is not None and cached[0]() is self.registry and cached[1] == count:
+            return cached[2]
+
+        # Existing materials in registry plus ALL NIST/G4 materials using
+        # pyg4ometry's built-in list; a set drops the overlap in one pass
+        materials = set(self.registry.materialDict)
+        materials.update(_nist_materials())
+        materials = tuple(sorted(materials))
+        InsertVolumeDialog._materials_cache = (weakref.ref(self.registry), count, materials,
+                                               _choice_index(materials))
         return materials
     
+    def _filter_materials(self, event=None):
+        """Narrow the material dropdown to names matching the typed text."""
+        if event is not None and event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        self.material_combo['values'] = _match_choices(self._material_index, self.material_var.get())
+
     def add_param_field(self, label, param_name, default_value):
         """Add a parameter input field."""
-        frame = ttk.Frame(self.params_container)
+        frame = ttk.Frame(self._params_frame)
         frame.pack(fill=tk.X, pady=3)
         
         ttk.Label(frame, text=label + ":", width=30, anchor=tk.W).pack(side=tk.LEFT)
@@ -289,7 +594,7 @@ class InsertVolumeDialog:
     
     def add_file_selector(self, label, param_name):
         """Add a file selector field."""
-        frame = ttk.Frame(self.params_container)
+        frame = ttk.Frame(self._params_frame)
         frame.pack(fill=tk.X, pady=3)
         
         ttk.Label(frame, text=label + ":", width=30, anchor=tk.W).pack(side=tk.TOP, anchor=tk.W)
@@ -317,7 +622,7 @@ class InsertVolumeDialog:
     
     def add_option_checkbox(self, label, param_name):
         """Add a checkbox option."""
-        frame = ttk.Frame(self.params_container)
+        frame = ttk.Frame(self._params_frame)
         frame.pack(fill=tk.X, pady=3)
         
         var = tk.BooleanVar(value=False)
@@ -327,6 +632,7 @@ class InsertVolumeDialog:
     
     def insert_volume(self):
         """Create and insert the volume."""
+        vol_name = None
         try:
             import pyg4ometry.geant4 as g4
             
@@ -342,41 +648,16 @@ class InsertVolumeDialog:
                 messagebox.showerror("Error", f"Volume '{vol_name}' already exists")
                 return
             
-            material_name = self.material_var.get()
+            material_name = self.material_var.get().strip()
             if not material_name:
                 messagebox.showerror("Error", "Please select a material")
                 return
             
             # Get or create material
-            if material_name in self.registry.materialDict:
-                obj = self.registry.materialDict[material_name]
-                # If it's an Element (not Material), we need to create a proper Material
-                if isinstance(obj, g4.Element):
-                    # This can happen if G4_Si was created as an Element for material composition
-                    # Create a proper Material for it
-                    if material_name.startswith('G4_'):
-                        try:
-                            material = g4.MaterialPredefined(material_name, self.registry)
-                        except ValueError:
-                            messagebox.showerror("Error", f"Failed to create G4 material: {material_name}")
-                            return
-                    else:
-                        messagebox.showerror("Error", f"Material '{material_name}' is an element, not a material")
-                        return
-                else:
-                    material = obj
-            elif material_name.startswith('G4_'):
-                # Use MaterialPredefined for G4 built-in materials (avoids Material_ prefix)
-                try:
-                    material = g4.MaterialPredefined(material_name, self.registry)
-                except ValueError:
-                    messagebox.showerror("Error", f"Failed to create G4 material: {material_name}")
-                    return
-            else:
-                messagebox.showerror(
-                    "Error",
-                    f"Material '{material_name}' not found in registry or NIST list."
-                )
+            try:
+                material = _resolve_material(self.registry, material_name)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
                 return
             
             parent_lv = self.registry.logicalVolumeDict[self.parent_var.get()]
@@ -410,9 +691,12 @@ class InsertVolumeDialog:
                     return
                 
                 use_flat = params.get('use_flat', False)
-                lv = self._load_step_as_volume(step_file, vol_name, material, use_flat)
-                if not lv:
-                    return
+                self._run_cad_load(
+                    "STEP", self._read_step_file, (step_file, use_flat),
+                    lambda step_data: self._load_step_as_volume(step_data, vol_name, material, use_flat),
+                    (vol_name, shape_type, material_name, parent_lv),
+                )
+                return
                     
             elif shape_type == "STL File":
                 # Load STL file and create tessellated solid
@@ -422,51 +706,37 @@ class InsertVolumeDialog:
                     return
                 
                 lin_def = params.get('lin_def', 0.5)
-                lv = self._load_stl_as_volume(stl_file, vol_name, material, lin_def)
-                if not lv:
-                    return
+                self._run_cad_load(
+                    "STL", self._read_stl_file, (stl_file, lin_def),
+                    lambda facets: self._load_stl_as_volume(facets, vol_name, material),
+                    (vol_name, shape_type, material_name, parent_lv),
+                )
+                return
             
-            elif shape_type == "Box":
-                solid = g4.solid.Box(solid_name, params['pX'], params['pY'], params['pZ'], 
-                                    self.registry, lunit=lunit)
-                lv = g4.LogicalVolume(solid, material, vol_name, self.registry)
-                
-            elif shape_type == "Sphere":
-                solid = g4.solid.Sphere(solid_name, params['pRMin'], params['pRMax'],
-                                       params['pSPhi'], params['pDPhi'], params['pSTheta'], params['pDTheta'],
-                                       self.registry, lunit=lunit, aunit="deg")
-                lv = g4.LogicalVolume(solid, material, vol_name, self.registry)
-                
-            elif shape_type == "Cylinder" or shape_type == "Tube":
-                solid = g4.solid.Tubs(solid_name, params['pRMin'], params['pRMax'], params['pDz'],
-                                     params['pSPhi'], params['pDPhi'],
-                                     self.registry, lunit=lunit, aunit="deg")
-                lv = g4.LogicalVolume(solid, material, vol_name, self.registry)
-                
-            elif shape_type == "Cone":
-                solid = g4.solid.Cons(solid_name, params['pRMin1'], params['pRMax1'],
-                                     params['pRMin2'], params['pRMax2'], params['pDz'],
-                                     params['pSPhi'], params['pDPhi'],
-                                     self.registry, lunit=lunit, aunit="deg")
-                lv = g4.LogicalVolume(solid, material, vol_name, self.registry)
-                
-            elif shape_type == "Torus":
-                solid = g4.solid.Torus(solid_name, params['pRMin'], params['pRMax'], params['pRTor'],
-                                      params['pSPhi'], params['pDPhi'],
-                                      self.registry, lunit=lunit, aunit="deg")
+            elif shape_type in _SHAPE_TABLE:
+                ctor_name, param_names, has_angles = _SHAPE_TABLE[shape_type]
+                kwargs = {'lunit': lunit, 'aunit': "deg"} if has_angles else {'lunit': lunit}
+                solid = getattr(g4.solid, ctor_name)(solid_name, *[params[n] for n in param_names],
+                                                     self.registry, **kwargs)
                 lv = g4.LogicalVolume(solid, material, vol_name, self.registry)
             else:
                 messagebox.showerror("Error", f"Unsupported shape type: {shape_type}")
                 return
             
-            # Parse position and rotation - convert position to mm (internal unit)
-            lunit = self.length_unit_var.get()
-            unit_to_mm = {'mm': 1.0, 'cm': 10.0, 'm': 1000.0}
-            scale = unit_to_mm.get(lunit, 1.0)
+            self._place_volume(lv, vol_name, shape_type, material_name, parent_lv)
             
-            pos = [float(self.pos_x.get()) * scale, 
-                   float(self.pos_y.get()) * scale, 
-                   float(self.pos_z.get()) * scale]
+        except Exception as e:
+            self._cleanup_failed_insert(vol_name)
+            messagebox.showerror("Error", f"Failed to create volume:\n{str(e)}")
+    
+    def _place_volume(self, lv, vol_name, shape_type, material_name, parent_lv):
+        """Place ``lv`` inside ``parent_lv`` and close the dialog."""
+        try:
+            import pyg4ometry.geant4 as g4
+            
+            # Parse position and rotation - convert position to mm (internal unit)
+            scale = _UNIT_TO_MM.get(self.length_unit_var.get(), 1.0)
+            pos = [float(v.get()) * scale for v in (self.pos_x, self.pos_y, self.pos_z)]
             rot = [float(self.rot_x.get()), float(self.rot_y.get()), float(self.rot_z.get())]
             
             # Create physical volume (position is now in mm)
@@ -476,127 +746,202 @@ class InsertVolumeDialog:
             # Some pyg4ometry objects/versions don't consistently back-fill both the parent's
             # `daughterVolumes` and `registry.physicalVolumeDict`. Ensure the placement is
             # discoverable for the hierarchy tree and VTK export.
-            try:
-                pv_dict = getattr(self.registry, 'physicalVolumeDict', None)
-                if isinstance(pv_dict, dict) and pv_name not in pv_dict:
-                    pv_dict[pv_name] = pv
-            except Exception:
-                pass
+            pv_dict = self._pv_dict
+            if pv_dict is not None and pv_name not in pv_dict:
+                pv_dict[pv_name] = pv
 
-            try:
-                daughters = getattr(parent_lv, 'daughterVolumes', None)
-                if isinstance(daughters, list) and pv not in daughters:
-                    daughters.append(pv)
-            except Exception:
-                pass
+            # A freshly created pv can only be in the list if the constructor
+            # just appended it, so checking the last entry is enough
+            daughters = getattr(parent_lv, 'daughterVolumes', None)
+            if isinstance(daughters, list) and (not daughters or daughters[-1] is not pv):
+                daughters.append(pv)
             
             self.result = {
                 'name': vol_name,
                 'shape': shape_type,
-                'material': material_name
+                'material': material_name,
+                'parent': parent_lv.name
             }
             
             self.dialog.destroy()
             
         except Exception as e:
-            # Clean up partially created objects on failure
-            try:
-                # Remove the logical volume if it was created
-                if vol_name in self.registry.logicalVolumeDict:
-                    del self.registry.logicalVolumeDict[vol_name]
-                
-                # Remove the solid if it was created
-                solid_name = f"{vol_name}_solid"
-                if solid_name in self.registry.solidDict:
-                    del self.registry.solidDict[solid_name]
-                
-                # Remove physical volume if it was created
-                pv_name = f"{vol_name}_pv"
-                pv_dict = getattr(self.registry, 'physicalVolumeDict', {})
-                if pv_name in pv_dict:
-                    del pv_dict[pv_name]
-            except Exception as cleanup_error:
-                print(f"Warning: Cleanup failed: {cleanup_error}")
-            
+            self._cleanup_failed_insert(vol_name)
             messagebox.showerror("Error", f"Failed to create volume:\n{str(e)}")
     
+    def _cleanup_failed_insert(self, vol_name):
+        """Remove partially created objects after a failed insert."""
+        try:
+            # Remove the logical volume if it was created
+            if vol_name in self.registry.logicalVolumeDict:
+                del self.registry.logicalVolumeDict[vol_name]
+            
+            # Remove the solid if it was created
+            solid_name = f"{vol_name}_solid"
+            if solid_name in self.registry.solidDict:
+                del self.registry.solidDict[solid_name]
+            
+            # Remove physical volume if it was created
+            pv_name = f"{vol_name}_pv"
+            pv_dict = getattr(self.registry, 'physicalVolumeDict', {})
+            if pv_name in pv_dict:
+                del pv_dict[pv_name]
+        except Exception as cleanup_error:
+            logger.warning("Cleanup failed: %s", cleanup_error)
+    
+    def _run_cad_load(self, label, read, args, build, placement):
+        """Read a CAD file on a worker thread while the dialog stays responsive.
+
+        ``read(*args)`` runs off the Tk thread and must touch neither Tk nor
+        ``self.registry``. Once it finishes, ``build`` turns its result into a
+        logical volume on the Tk thread, which is then placed with
+        :meth:`_place_volume` using the ``placement`` arguments.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(read, *args)
+        executor.shutdown(wait=False)
+
+        self.insert_button.config(state=tk.DISABLED)
+        self.progress.pack(fill=tk.X, pady=5)
+        self.progress.start(10)
+        self._poll_cad_load(label, future, build, placement)
+
+    def _poll_cad_load(self, label, future, build, placement):
+        """Check on a :meth:`_run_cad_load` worker every 50 ms."""
+        # Cancelled: the dialog is gone, so the worker's result is just dropped.
+        # Polling goes through the parent since the dialog's own timers die with it.
+        if not self.dialog.winfo_exists():
+            return
+        if not future.done():
+            self.parent.after(50, self._poll_cad_load, label, future, build, placement)
+            return
+
+        self.progress.stop()
+        self.progress.pack_forget()
+        self.insert_button.config(state=tk.NORMAL)
+
+        error = future.exception()
+        if error is not None:
+            import traceback
+            details = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+            messagebox.showerror("Error", f"Failed to load {label} file:\n{str(error)}\n\n{details}")
+            return
+
+        lv = build(future.result())
+        if lv:
+            self._place_volume(lv, *placement)
+    
     def _convert_density(self, density, unit):
         """Convert density to g/cm³."""
-        conversion = {'g/cm3': 1.0, 'mg/cm3': 1e-3, 'kg/m3': 1e-3}
-        return density * conversion.get(unit, 1.0)
+        return density * _DENSITY_TO_G_CM3.get(unit, 1.0)
+    
+    def _read_step_file(self, step_file, use_flat):
+        """Read a STEP file (worker thread).
+
+        Returns the indexed mesh from :func:`_mesh_to_facets` in flat mode. In hierarchy mode returns the
+        STEP registry plus each placement's evaluated ``(rotation, position)``
+        keyed by ``id(pv)`` (pv names need not be unique across mothers),
+        so the Tk thread only has to create the volumes.
+        """
+        import pyg4ometry.geant4 as g4
+        import pyg4ometry.pyoce
+        
+        logger.info("Loading STEP file: %s", step_file)
+        reader = pyg4ometry.pyoce.Reader(step_file)
+        
+        if use_flat:
+            # Flat mode: convert OCC shape to mesh
+            logger.debug("Using flat tessellation mode")
+            oce_shape = reader.getShapeFromRefs()
+            return _mesh_to_facets(g4.solid.MeshExtractAndReduceToTriangles(oce_shape))
+        
+        # Hierarchy mode: preserve structure in a separate registry
+        logger.debug("Using hierarchy mode (CSG where possible)")
+        hierarchy_reg = pyg4ometry.pyoce.oce2Geant4(reader)
+        transforms = {
+            id(pv): _eval_placement(pv)
+            for lv in hierarchy_reg.logicalVolumeDict.values()
+            for pv in lv.daughterVolumes
+        }
+        return hierarchy_reg, transforms
     
-    def _load_step_as_volume(self, step_file, vol_name, material, use_flat):
-        """Load STEP file and create logical volume."""
+    def _load_step_as_volume(self, step_data, vol_name, material, use_flat):
+        """Create logical volume from :meth:`_read_step_file` output."""
         try:
             import pyg4ometry.geant4 as g4
-            import pyg4ometry.pyoce
-            
-            print(f"Loading STEP file: {step_file}")
-            reader = pyg4ometry.pyoce.Reader(step_file)
             
             if use_flat:
                 # Flat mode: single tessellated solid
-                print("Using flat tessellation mode...")
-                oce_shape = reader.getShapeFromRefs()
-                tess_solid = g4.solid.TessellatedSolid(f"{vol_name}_tess", self.registry)
-                
-                # Convert OCC shape to mesh
-                mesh = pyg4ometry.geant4.solid.MeshExtractAndReduceToTriangles(oce_shape)
-                for triangle in mesh:
-                    v1, v2, v3 = triangle
-                    tess_solid.addTriangularFacet([v1, v2, v3])
+                # The whole indexed mesh goes in at construction
+                tess_solid = g4.solid.TessellatedSolid(f"{vol_name}_tess", step_data, self.registry,
+                                                       g4.solid.TessellatedSolid.MeshType.Freecad)
                 
                 lv = g4.LogicalVolume(tess_solid, material, vol_name, self.registry)
-                print(f"✓ Created flat tessellated volume: {vol_name}")
+                logger.info("Created flat tessellated volume: %s", vol_name)
             else:
                 # Hierarchy mode: preserve structure
-                print("Using hierarchy mode (CSG where possible)...")
-                hierarchy_reg = pyg4ometry.pyoce.oce2Geant4(reader)
+                hierarchy_reg, transforms = step_data
                 
                 # Get the top-level logical volume
                 world_lv = hierarchy_reg.getWorldVolume()
                 
-                # Merge all volumes from STEP into current registry
-                for lv_name, step_lv in hierarchy_reg.logicalVolumeDict.items():
-                    # Rename to avoid conflicts
-                    new_lv_name = f"{vol_name}_{lv_name}" if lv_name != world_lv.name else vol_name
+                # New name for every STEP LV, computed once
+                name_map = {name: f"{vol_name}_{name}" for name in hierarchy_reg.logicalVolumeDict}
+                name_map[world_lv.name] = vol_name
+                
+                # Merge volumes into current registry in post-order (DFS from the STEP
+                # top-level volume) so each LV is created exactly once and every
+                # daughter exists before the mother that places it
+                new_lvs = {}
+                new_solids = {}
+                stack = [(world_lv, False)]
+                while stack:
+                    step_lv, children_done = stack.pop()
+                    if step_lv.name in new_lvs:
+                        continue
+                    if not children_done:
+                        stack.append((step_lv, True))
+                        stack.extend((pv.logicalVolume, False) for pv in step_lv.daughterVolumes
+                                     if pv.logicalVolume.name not in new_lvs)
+                        continue
                     
-                    # Add solid to registry
-                    if hasattr(step_lv, 'solid'):
-                        solid = step_lv.solid
-                        new_solid_name = f"{vol_name}_{solid.name}"
-                        solid.name = new_solid_name
-                        if new_solid_name not in self.registry.solidDict:
-                            self.registry.solidDict[new_solid_name] = solid
+                    # Rename solid to avoid conflicts; registered in one batch below
+                    solid = step_lv.solid
+                    new_solid_name = f"{vol_name}_{solid.name}"
+                    solid.name = new_solid_name
+                    new_solids.setdefault(new_solid_name, solid)
                     
                     # Create new logical volume in target registry
-                    new_lv = g4.LogicalVolume(step_lv.solid, material, new_lv_name, self.registry)
+                    new_lv = g4.LogicalVolume(solid, material, name_map[step_lv.name], self.registry)
+                    new_lvs[step_lv.name] = new_lv
                     
-                    # Copy daughter volumes
+                    # Place the (already merged) daughters
                     for pv in step_lv.daughterVolumes:
-                        # Recursively rename and add daughters
-                        daughter_lv_name = pv.logicalVolume.name
-                        new_daughter_name = f"{vol_name}_{daughter_lv_name}"
-                        
-                        if new_daughter_name in self.registry.logicalVolumeDict:
-                            daughter_lv = self.registry.logicalVolumeDict[new_daughter_name]
-                        else:
-                            continue  # Will be processed in loop
-                        
-                        # Create physical volume in new registry
                         new_pv_name = f"{vol_name}_{pv.name}"
+                        cnt = 1
+                        while new_pv_name in self.registry.physicalVolumeDict:
+                            new_pv_name = f"{vol_name}_{pv.name}_{cnt}"
+                            cnt += 1
+                        rot, pos = transforms.get(id(pv)) or _eval_placement(pv)
                         g4.PhysicalVolume(
-                            pv.rotation.eval() if hasattr(pv.rotation, 'eval') else [0, 0, 0],
-                            pv.position.eval() if hasattr(pv.position, 'eval') else [0, 0, 0],
-                            daughter_lv,
+                            rot,
+                            pos,
+                            new_lvs[pv.logicalVolume.name],
                             new_pv_name,
                             new_lv,
                             self.registry
                         )
                 
+                # Add the renamed solids, keeping any existing entry of the same name
+                solid_dict = self.registry.solidDict
+                solid_dict.update({name: solid for name, solid in new_solids.items()
+                                   if name not in solid_dict})
+                
                 # Return the top-level volume
-                lv = self.registry.logicalVolumeDict.get(vol_name, new_lv)
-                print(f"✓ Created hierarchical volume structure: {vol_name}")
+                lv = new_lvs[world_lv.name]
+                logger.info("Created hierarchical volume structure: %s", vol_name)
             
             return lv
             
@@ -605,30 +950,32 @@ class InsertVolumeDialog:
             messagebox.showerror("Error", f"Failed to load STEP file:\n{str(e)}\n\n{traceback.format_exc()}")
             return None
     
-    def _load_stl_as_volume(self, stl_file, vol_name, material, lin_def):
-        """Load STL file and create tessellated solid."""
+    def _read_stl_file(self, stl_file, lin_def):
+        """Read an STL file (worker thread) and return its triangles as facets."""
+        import pyg4ometry.geant4 as g4
+        import pyg4ometry.stl as stl
+        
+        logger.info("Loading STL file: %s", stl_file)
+        # The reader registers a solid of its own: keep that out of self.registry,
+        # which the Tk thread may be reading meanwhile
+        reader = stl.Reader(stl_file, registry=g4.Registry())
+        
+        # Each facet is ((v1, v2, v3), normal); only the vertices are needed
+        return _mesh_to_facets([vertices for vertices, _normal in reader.facet_list])
+    
+    def _load_stl_as_volume(self, facets, vol_name, material):
+        """Create tessellated solid from :meth:`_read_stl_file` output."""
         try:
             import pyg4ometry.geant4 as g4
-            import pyg4ometry.stl as stl
-            
-            print(f"Loading STL file: {stl_file}")
-            reader = stl.Reader(stl_file, registry=self.registry, addRegistry=False)
-            
-            # Create tessellated solid
-            tess_solid = g4.solid.TessellatedSolid(f"{vol_name}_tess", self.registry)
-            
-            # Get mesh from STL reader
-            mesh = reader.getMesh()
             
-            # Add triangles to tessellated solid
-            for triangle in mesh:
-                v1, v2, v3 = triangle
-                tess_solid.addTriangularFacet([list(v1), list(v2), list(v3)])
+            # Create tessellated solid, handing it the whole indexed mesh at once
+            tess_solid = g4.solid.TessellatedSolid(f"{vol_name}_tess", facets, self.registry,
+                                                   g4.solid.TessellatedSolid.MeshType.Freecad)
             
             # Create logical volume
             lv = g4.LogicalVolume(tess_solid, material, vol_name, self.registry)
             
-            print(f"✓ Created STL tessellated volume: {vol_name} ({len(mesh)} triangles)")
+            logger.info("Created STL tessellated volume: %s (%d triangles)", vol_name, len(facets[1]))
             return lv
             
         except Exception as e:
@@ -640,9 +987,10 @@ class InsertVolumeDialog:
 class InsertGDMLDialog:
     """Dialog for inserting volumes from an external GDML file."""
 
-    def __init__(self, parent, registry, world_lv):
+    def __init__(self, parent, registry, world_lv, volume_names=None):
         self.registry = registry
         self.world_lv = world_lv
+        self.volume_names = volume_names
         self.result = None
 
         self.dialog = tk.Toplevel(parent)
@@ -667,7 +1015,7 @@ class InsertGDMLDialog:
         def browse_file():
             filename = filedialog.askopenfilename(
                 title="Select GDML File",
-                filetypes=[("GDML Files", "*.gdml"), ("All Files", "*.*")],
+                filetypes=[("GDML Files", "*.gdml"), ("Compressed GDML", "*.gdml.gz"), ("All Files", "*.*")],
             )
             if filename:
                 self.file_var.set(filename)
@@ -686,8 +1034,9 @@ class InsertGDMLDialog:
         parent_frame.pack(fill=tk.X, pady=5)
         ttk.Label(parent_frame, text="Parent Volume:", width=15).pack(side=tk.LEFT)
         self.parent_var = tk.StringVar(value=self.world_lv.name)
-        volumes = list(self.registry.logicalVolumeDict.keys())
-        volumes.sort()
+        volumes = self.volume_names
+        if volumes is None:
+            volumes = sorted(self.registry.logicalVolumeDict)
         ttk.Combobox(parent_frame, textvariable=self.parent_var, values=volumes, state='readonly', width=28).pack(
             side=tk.LEFT, padx=5
         )
@@ -737,11 +1086,9 @@ class InsertGDMLDialog:
             return
 
         try:
-            import pyg4ometry.gdml as gdml
             import pyg4ometry.geant4 as g4
 
-            reader = gdml.Reader(filename)
-            ext_reg = reader.getRegistry()
+            ext_reg = _read_gdml(filename)
             ext_world = ext_reg.getWorldVolume()
 
             prefix = (self.prefix_var.get() or "").strip()
@@ -808,13 +1155,55 @@ class GDMLEditorApp:
         self.registry = None
         self.world_lv = None
         self.modified = False
+        # Bumped on every registry change; the viewer file records the epoch it shows
+        self._registry_epoch = 0
+        self._viewer_epoch = None
         
         # VTK viewer tracking
         self.viewer_temp_file = None
         self.viewer_process = None
+        # Linux pidfd watched by the Tk event loop to learn when the viewer exits
+        self._viewer_pidfd = None
+        # Pending timer that writes the viewer file once per burst of edits
+        self._viewer_after = None
+        # Single worker that writes rendered GDML to the viewer file, in order
+        self._viewer_executor = None
+        # (registry epoch, future) of the last write handed to that worker
+        self._viewer_write = None
+        self._viewer_banner_shown = False
+        
+        # Search debounce timer, sorted LV names and their (lowercase, name) pairs
+        self._search_after = None
+        self._lv_names = None
+        self._lv_name_index = None
+        self._children_by_mother = None
+        # Search text whose flat result list the tree currently shows
+        self._filter_shown = None
+        # (weakref to registry, material count, sorted material names) for the material dropdown
+        self._all_materials = None
+        self._material_dropdown_values = None
+        # LV name -> text of the tree's material column
+        self._material_labels = {}
+        # The world LV only changes when a file is loaded
+        self._world_name = None
         
         self.setup_ui()
         
+        # Import pyg4ometry in the background once the window is mapped, so opening
+        # or viewing the first file finds it in sys.modules
+        self._prewarm_scheduled = False
+        self._prewarm_binding = self.root.bind("<Map>", self._on_first_map, "+")
+        
+    def _on_first_map(self, event):
+        """One-shot ``<Map>`` handler: start the pyg4ometry prewarm thread."""
+        # Children's <Map> events reach the toplevel's binding too
+        if event.widget is not self.root or self._prewarm_scheduled:
+            return
+        self._prewarm_scheduled = True
+        self.root.unbind("<Map>", self._prewarm_binding)
+        import threading
+        threading.Thread(target=_prewarm_pyg4ometry, daemon=True).start()
+    
     def setup_ui(self):
         """Create the user interface."""
         # Menu bar
@@ -865,7 +1254,7 @@ class GDMLEditorApp:
         search_frame.pack(fill=tk.X, padx=5, pady=5)
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self.filter_volumes)
+        self.search_var.trace('w', self._on_search_changed)
         ttk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
         # Volume list with scrollbar
@@ -884,6 +1273,7 @@ class GDMLEditorApp:
         scrollbar.config(command=self.volume_tree.yview)
         
         self.volume_tree.bind('<<TreeviewSelect>>', self.on_volume_select)
+        self.volume_tree.bind('<<TreeviewOpen>>', self._on_node_expand)
         
         # Right panel - Properties
         right_frame = ttk.Frame(main_paned)
@@ -936,15 +1326,12 @@ class GDMLEditorApp:
         self.status_var = tk.StringVar(value="Ready. Open a GDML file to begin.")
         status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-
-        # Initialize dropdown values (will populate after a GDML is loaded)
-        self._cached_nist_materials = None
         
     def open_gdml(self):
         """Open a GDML file using pyg4ometry Reader."""
         filename = filedialog.askopenfilename(
             title="Open GDML File",
-            filetypes=[("GDML Files", "*.gdml"), ("All Files", "*.*")]
+            filetypes=[("GDML Files", "*.gdml"), ("Compressed GDML", "*.gdml.gz"), ("All Files", "*.*")]
         )
         
         if not filename:
@@ -958,18 +1345,22 @@ class GDMLEditorApp:
         self.root.update()
         
         try:
-            import pyg4ometry.gdml as gdml
             import pyg4ometry.geant4 as g4
             
-            # Use pyg4ometry's GDML reader
-            reader = gdml.Reader(filename)
-            self.registry = reader.getRegistry()
+            # Use pyg4ometry's GDML reader (transparently unpacking .gdml.gz)
+            self.registry = _read_gdml(filename)
             
             self.world_lv = self.registry.getWorldVolume()
+            self._world_name = getattr(self.world_lv, 'name', None)
             self.gdml_file = filename
             self.modified = False
+            # A different registry: whatever the viewer file holds is stale, and
+            # the material list must not keep the old one alive
+            self._registry_epoch += 1
+            self._all_materials = None
             
             # Update UI
+            self._invalidate_volume_caches()
             self.populate_volume_tree()
             self.update_material_list()
             
@@ -995,6 +1386,7 @@ class GDMLEditorApp:
     def populate_volume_tree(self):
         """Populate the volume tree with hierarchical structure."""
         self.volume_tree.delete(*self.volume_tree.get_children())
+        self._filter_shown = None
         
         if not self.registry:
             return
@@ -1009,13 +1401,187 @@ class GDMLEditorApp:
         if not self.world_lv:
             return
 
+        # Only the world and its daughters are inserted; deeper rows appear on expand
+        self._add_tree_item(world_name, '')
+        self._expand_tree_item(world_name)
+    
+    def _add_tree_item(self, lv_name, parent_item, index='end'):
+        """Insert the row for ``lv_name``; its daughters are added when it is first opened."""
+        insert = self.volume_tree.insert
+        item_id = insert(parent_item, index, lv_name, text=lv_name, values=(self._material_label(lv_name),))
+        if self._children_map().get(lv_name):
+            insert(item_id, 'end', _LAZY_CHILD + item_id, text="")
+        return item_id
+    
+    def _expand_tree_item(self, item_id):
+        """Replace ``item_id``'s placeholder row with its daughter rows (once)."""
+        placeholder = _LAZY_CHILD + item_id
+        if not self.volume_tree.exists(placeholder):
+            return
+        self.volume_tree.delete(placeholder)
+        exists = self.volume_tree.exists
+        add_tree_item = self._add_tree_item
+        for child_name in self._children_map().get(item_id, ()):
+            # A volume placed in several mothers is listed once, under the first one opened
+            if not exists(child_name):
+                add_tree_item(child_name, item_id)
+    
+    def _material_label(self, lv_name):
+        """Return the material column text for ``lv_name``, computed once per LV."""
+        label = self._material_labels.get(lv_name)
+        if label is None:
+            lv = self.registry.logicalVolumeDict.get(lv_name)
+            if lv and hasattr(lv, "material") and lv.material:
+                label = lv.material.name if hasattr(lv.material, "name") else str(lv.material)
+            else:
+                label = "(Assembly)"
+            self._material_labels[lv_name] = label
+        return label
+    
+    def _on_node_expand(self, event=None):
+        """Fill in the daughters of the row being opened."""
+        self._expand_tree_item(self.volume_tree.focus())
+    
+    def _reveal_volume(self, name):
+        """Expand the tree down to ``name`` and scroll to it; returns False if it is not shown."""
+        tree = self.volume_tree
+        if not tree.exists(name):
+            mothers = {}
+            for mother, kids in self._children_map().items():
+                for kid in kids:
+                    mothers.setdefault(kid, []).append(mother)
+            # Walk up to the world, then open the chain top-down
+            chain, seen, current = [], {name}, name
+            while current in mothers:
+                current = min(mothers[current], key=lambda s: s.lower())
+                if current in seen:
+                    break
+                seen.add(current)
+                chain.append(current)
+            for mother in reversed(chain):
+                if tree.exists(mother):
+                    self._expand_tree_item(mother)
+            if not tree.exists(name):
+                return False
+        tree.see(name)
+        return True
+    
+    def refresh_volume_tree(self):
+        """Alias for populate_volume_tree - refreshes the tree display."""
+        self.populate_volume_tree()
+    
+    def _showing_hierarchy(self):
+        """True when the tree shows the full hierarchy rather than search results."""
+        return not (self.search_var.get() or "").strip()
+    
+    def _sibling_index(self, parent_item, name, exclude=None):
+        """Return where ``name`` goes among ``parent_item``'s case-insensitively sorted children."""
+        keys = [iid.lower() for iid in self.volume_tree.get_children(parent_item) if iid != exclude]
+        return bisect.bisect_right(keys, name.lower())
+    
+    def _tree_volume_added(self, name, parent_name):
+        """Show a newly placed volume without rebuilding the whole tree."""
+        tree = self.volume_tree
+        if not self._showing_hierarchy() or not tree.exists(parent_name) or tree.exists(name):
+            self.refresh_volume_tree()
+            return
+        placeholder = _LAZY_CHILD + parent_name
+        if tree.exists(placeholder):
+            # Daughters not inserted yet: they are built, new one included, on expand
+            return
+        if tree.get_children(parent_name):
+            self._add_tree_item(name, parent_name, self._sibling_index(parent_name, name))
+        else:
+            # First daughter: leave it to the placeholder like any other row
+            tree.insert(parent_name, 'end', placeholder, text="")
+    
+    def _tree_volume_removed(self, name, mother_names):
+        """Drop a deleted volume's row without rebuilding the whole tree."""
+        tree = self.volume_tree
+        if not self._showing_hierarchy():
+            # Search results are a flat list: only the deleted row goes
+            if tree.exists(name):
+                tree.delete(name)
+            return
+        if tree.exists(name):
+            # Shown daughters go with the row. One that is still placed outside
+            # the dropped rows must reappear there, so leave that case to a rebuild.
+            dropped, stack = {name}, list(tree.get_children(name))
+            while stack:
+                child = stack.pop()
+                if not child.startswith(_LAZY_CHILD):
+                    dropped.add(child)
+                    stack.extend(tree.get_children(child))
+            _, pvs_by_child = self._pv_indices()
+            pv_parents = self._pv_parents
+            for child in dropped:
+                for pv in pvs_by_child.get(child, ()):
+                    mother = pv_parents.get(id(pv)) or getattr(pv, 'motherVolume', None)
+                    if getattr(mother, 'name', mother) not in dropped:
+                        self.refresh_volume_tree()
+                        return
+            tree.delete(name)
+        # A collapsed mother that just lost its only daughter keeps no expander
+        children = self._children_map()
+        for mother in mother_names:
+            placeholder = _LAZY_CHILD + mother
+            if not children.get(mother) and tree.exists(placeholder):
+                tree.delete(placeholder)
+    
+    def _tree_volume_renamed(self, old_name, new_name):
+        """Rename a tree row in place; Treeview ids are immutable, so the row is re-created."""
+        tree = self.volume_tree
+        if not self._showing_hierarchy() or not tree.exists(old_name) or tree.exists(new_name):
+            self.refresh_volume_tree()
+            return
+        parent = tree.parent(old_name)
+        index = self._sibling_index(parent, new_name, exclude=old_name)
+        tree.insert(parent, 'end', new_name, text=new_name, values=tree.item(old_name, 'values'),
+                    open=tree.item(old_name, 'open'))
+        for child in tree.get_children(old_name):
+            if child == _LAZY_CHILD + old_name:
+                tree.insert(new_name, 'end', _LAZY_CHILD + new_name, text="")
+            else:
+                tree.move(child, new_name, 'end')
+        tree.delete(old_name)
+        tree.move(new_name, parent, index)
+    
+    def _mark_modified(self):
+        """Record an edit of the registry (unsaved changes, viewer file out of date)."""
+        self.modified = True
+        self._registry_epoch += 1
+
+    def _invalidate_volume_caches(self):
+        """Drop data derived from the registry's logical volumes."""
+        self._lv_names = None
+        self._lv_name_index = None
+        self._children_by_mother = None
+        self._material_labels = {}
+    
+    def _children_map(self):
+        """Return mother LV name -> sorted daughter LV names, rebuilt only after topology changes."""
+        if self._children_by_mother is not None:
+            return self._children_by_mother
+
         # Build hierarchy from the registry, but be tolerant:
         # - Some operations update `lv.daughterVolumes` reliably.
         # - Others are only reliably reflected in `registry.physicalVolumeDict`.
         # We merge both sources (by LV names) so the UI refresh always matches the current registry.
+        import weakref
         from collections import defaultdict
 
-        children_by_mother: dict[str, set[str]] = defaultdict(set)
+        children_by_mother: dict[str, list[str]] = defaultdict(list)
+        # Placements indexed by mother and by placed LV, id(pv) -> mother LV
+        # (pv names repeat across mothers; weak, so the index never keeps a
+        # dropped LV alive), and solid
+        # name -> number of LVs built from it
+        pvs_by_mother = defaultdict(list)
+        pvs_by_child = defaultdict(list)
+        pv_parents = weakref.WeakValueDictionary()
+        solid_users = defaultdict(int)
+        # ids of the pvs already in each index, so no placement is listed twice
+        in_mother_index = set()
+        in_child_index = set()
 
         # 1) From physicalVolumeDict
         for pv in getattr(self.registry, "physicalVolumeDict", {}).values():
@@ -1034,64 +1600,173 @@ class GDMLEditorApp:
             else:
                 child = getattr(child_obj, "name", None) if child_obj is not None else None
 
+            if mother:
+                pvs_by_mother[mother].append(pv)
+                in_mother_index.add(id(pv))
+            if child:
+                pvs_by_child[child].append(pv)
+                in_child_index.add(id(pv))
             if mother and child:
-                children_by_mother[mother].add(child)
+                children_by_mother[mother].append(child)
 
-        # 2) From each LV's daughterVolumes
+        # 2) From each LV's daughterVolumes; placements missing from
+        # physicalVolumeDict are indexed here too
         for mother_name, mother_lv in getattr(self.registry, "logicalVolumeDict", {}).items():
+            solid = getattr(mother_lv, "solid", None)
+            if solid is not None:
+                solid_users[solid.name] += 1
             for pv in getattr(mother_lv, "daughterVolumes", []) or []:
+                pv_parents[id(pv)] = mother_lv
                 child_obj = getattr(pv, "logicalVolume", None)
                 child = getattr(child_obj, "name", None) if child_obj is not None else None
                 if child:
-                    children_by_mother[mother_name].add(child)
-
-        def add_lv_by_name(lv_name: str, parent_item: str, visited: set[str]):
-            if lv_name in visited:
-                return
-            visited.add(lv_name)
-
-            lv = self.registry.logicalVolumeDict.get(lv_name)
-            if lv and hasattr(lv, "material") and lv.material:
-                mat_name = lv.material.name if hasattr(lv.material, "name") else str(lv.material)
-            else:
-                mat_name = "(Assembly)"
-
-            item_id = self.volume_tree.insert(parent_item, 'end', lv_name, text=lv_name, values=(mat_name,))
-
-            for child_name in sorted(children_by_mother.get(lv_name, set()), key=lambda s: s.lower()):
-                add_lv_by_name(child_name, item_id, visited)
-
-        add_lv_by_name(world_name, '', set())
+                    children_by_mother[mother_name].append(child)
+                    if id(pv) not in in_child_index:
+                        pvs_by_child[child].append(pv)
+                if id(pv) not in in_mother_index:
+                    pvs_by_mother[mother_name].append(pv)
+
+        # Both sources usually agree: dedupe and sort each mother's list once
+        for mother, kids in children_by_mother.items():
+            children_by_mother[mother] = _sorted_case_insensitive(set(kids))
+
+        self._pvs_by_mother = pvs_by_mother
+        self._pvs_by_child = pvs_by_child
+        self._pv_parents = pv_parents
+        self._solid_users = solid_users
+        self._children_by_mother = children_by_mother
+        return children_by_mother
     
-    def refresh_volume_tree(self):
-        """Alias for populate_volume_tree - refreshes the tree display."""
-        self.populate_volume_tree()
+    def _pv_indices(self):
+        """Return (mother LV name -> pvs, placed LV name -> pvs), from both placement sources."""
+        self._children_map()
+        return self._pvs_by_mother, self._pvs_by_child
+    
+    def _sorted_lv_names(self):
+        """Return the logical volume names in sorted order (shared, do not modify)."""
+        # The length check rebuilds the list if the registry changed behind our back
+        if self._lv_names is None or len(self._lv_names) != len(self.registry.logicalVolumeDict):
+            self._lv_names = sorted(self.registry.logicalVolumeDict)
+        return self._lv_names
+    
+    def _volume_added(self, name):
+        """Record that logical volume ``name`` was added to the registry."""
+        names = self._lv_names
+        if names is not None and len(names) + 1 == len(self.registry.logicalVolumeDict):
+            bisect.insort(names, name)
+        else:
+            # Several volumes were added (e.g. a STEP assembly): rebuild on demand
+            self._lv_names = None
+        self._lv_name_index = None
+        self._children_by_mother = None
+    
+    def _volume_removed(self, name):
+        """Record that logical volume ``name`` was removed from the registry."""
+        names = self._lv_names
+        if names is not None:
+            i = bisect.bisect_left(names, name)
+            if i < len(names) and names[i] == name:
+                del names[i]
+        self._lv_name_index = None
+        self._material_labels.pop(name, None)
+    
+    def _index_volume_deleted(self, lv, placements, daughters):
+        """Update the cached indices in place for a deleted LV, its placements and its daughters."""
+        children = self._children_by_mother
+        if children is None:
+            return
+        pvs_by_mother, pvs_by_child = self._pvs_by_mother, self._pvs_by_child
+        pv_parents = self._pv_parents
+        doomed = {id(pv) for pv in placements}
+        doomed.update(id(pv) for pv in daughters)
+
+        # Every placement of the LV is gone, so it leaves each of its mothers' lists
+        # (the two placement sources may disagree on the mother, so try both)
+        for pv in placements:
+            for mother_obj in (pv_parents.get(id(pv)), getattr(pv, 'motherVolume', None)):
+                mother = mother_obj if isinstance(mother_obj, str) else getattr(mother_obj, 'name', None)
+                if mother in pvs_by_mother:
+                    pvs_by_mother[mother] = [p for p in pvs_by_mother[mother] if id(p) not in doomed]
+                if lv.name in children.get(mother, ()):
+                    children[mother] = [kid for kid in children[mother] if kid != lv.name]
+        # Its daughters lose the placements inside it
+        for pv in daughters:
+            child = getattr(getattr(pv, 'logicalVolume', None), 'name', None)
+            if child in pvs_by_child:
+                pvs_by_child[child] = [p for p in pvs_by_child[child] if id(p) not in doomed]
+        for pv_id in doomed:
+            pv_parents.pop(pv_id, None)
+        for index in (children, pvs_by_mother, pvs_by_child):
+            index.pop(lv.name, None)
+
+        solid = getattr(lv, 'solid', None)
+        if solid is not None and self._solid_users.get(solid.name, 0) > 0:
+            self._solid_users[solid.name] -= 1
+
+    def _volume_renamed(self, old_name, new_name):
+        """Record a rename; the hierarchy map is rekeyed rather than rebuilt."""
+        children = self._children_by_mother
+        label = self._material_labels.get(old_name)
+        self._volume_removed(old_name)
+        self._volume_added(new_name)
+        if label is not None:
+            self._material_labels[new_name] = label
+        if children is not None:
+            for index in (children, self._pvs_by_mother, self._pvs_by_child):
+                if old_name in index:
+                    index[new_name] = index.pop(old_name)
+            for mother, kids in children.items():
+                if old_name in kids:
+                    children[mother] = _sorted_case_insensitive(
+                        new_name if kid == old_name else kid for kid in kids)
+            self._children_by_mother = children
+    
+    def _on_search_changed(self, *args):
+        """Filter at most once per 150 ms pause in typing."""
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(150, self.filter_volumes)
     
     def filter_volumes(self, *args):
         """Filter volumes based on search text."""
+        self._search_after = None
         if not self.registry or not self.world_lv:
             return
         
         search_text = (self.search_var.get() or "").strip().lower()
         
+        # Nothing to do when the tree already shows this query (None: the hierarchy)
+        if (search_text or None) == self._filter_shown:
+            return
+        
         if not search_text:
             # No filter - show full hierarchy
             self.populate_volume_tree()
             return
         
         # Filter mode - show flat list of matching volumes
+        shown = self._filter_shown
+        self._filter_shown = search_text
+        if shown is not None and shown in search_text:
+            # Narrowed search: every match is already listed, drop the rest
+            stale = [iid for iid in self.volume_tree.get_children() if search_text not in iid.lower()]
+            if stale:
+                self.volume_tree.delete(*stale)
+            return
+        
         self.volume_tree.delete(*self.volume_tree.get_children())
         
-        for name, lv in sorted(self.registry.logicalVolumeDict.items()):
-            if search_text not in name.lower():
+        if self._lv_name_index is None:
+            self._lv_name_index = [(name.lower(), name) for name in self._sorted_lv_names()]
+        
+        # Bound methods looked up once for the per-match loop
+        insert = self.volume_tree.insert
+        material_label = self._material_label
+        for key, name in self._lv_name_index:
+            if search_text not in key:
                 continue
-                
-            if hasattr(lv, 'material') and lv.material:
-                mat_name = lv.material.name if hasattr(lv.material, 'name') else str(lv.material)
-            else:
-                mat_name = "(Assembly)"
             
-            self.volume_tree.insert('', 'end', name, text=name, values=(mat_name,))
+            insert('', 'end', name, text=name, values=(material_label(name),))
     
     def update_material_list(self):
         """Update the material dropdown list."""
@@ -1101,65 +1776,46 @@ class GDMLEditorApp:
         self._update_volume_material_dropdown()
 
     def _get_all_available_materials(self):
-        """Return combined list of materials: existing registry + all G4/NIST."""
+        """Return combined tuple of materials: existing registry + all G4/NIST.
+
+        Materials are only ever added, so the sorted tuple is reused while the
+        registry object and its material count are unchanged.
+        """
+        import weakref
+
         if not self.registry:
-            return []
+            return ()
 
-        materials = set(getattr(self.registry, 'materialDict', {}).keys())
+        material_dict = getattr(self.registry, 'materialDict', {})
+        cached = self._all_materials
+        if cached is not None and cached[0]() is self.registry and cached[1] == len(material_dict):
+            return cached[2]
 
-        # Cache the NIST list to avoid recomputing on every selection.
-        if self._cached_nist_materials is None:
-            try:
-                import pyg4ometry.geant4 as g4
-                self._cached_nist_materials = list(g4.getNistMaterialList())
-            except Exception:
-                self._cached_nist_materials = []
-        materials.update(self._cached_nist_materials)
+        materials = set(material_dict)
+        materials.update(_nist_materials())
+        materials = tuple(_sorted_case_insensitive(materials))
 
-        return sorted(materials, key=lambda s: s.lower())
+        # Weak, like the insert dialog's cache, so a replaced registry isn't pinned
+        self._all_materials = (weakref.ref(self.registry), len(material_dict), materials)
+        return materials
 
     def _update_volume_material_dropdown(self):
         """Refresh the material dropdown used in the Volume Properties panel."""
         if not self.registry:
             return
         values = self._get_all_available_materials()
+        # The cached tuple is reused while unchanged; skip marshalling it to Tcl again
+        if values is self._material_dropdown_values:
+            return
         self.volume_material_combo['values'] = values
+        self._material_dropdown_values = values
 
     def _ensure_material_in_registry(self, material_name):
         """Return a material object, creating it if needed."""
-        import pyg4ometry.geant4 as g4
-
         if not self.registry:
             raise ValueError("No registry loaded")
 
-        if material_name in self.registry.materialDict:
-            obj = self.registry.materialDict[material_name]
-            # If it's an Element (not Material), create a proper Material for it
-            if isinstance(obj, g4.Element):
-                # This can happen if G4_Si was created as an Element for material composition
-                # Create a proper Material for it
-                if material_name.startswith('G4_'):
-                    try:
-                        mat = g4.MaterialPredefined(material_name, self.registry)
-                        return mat
-                    except ValueError:
-                        raise ValueError(f"Material '{material_name}' exists only as Element, cannot use as material")
-                else:
-                    raise ValueError(f"'{material_name}' is an element, not a material")
-            return obj
-
-        if material_name.startswith('G4_'):
-            # Use MaterialPredefined for NIST/G4 built-in materials
-            # This avoids the Material_ prefix and doesn't define them in GDML
-            try:
-                mat = g4.MaterialPredefined(material_name, self.registry)
-                # MaterialPredefined automatically adds to registry
-                return mat
-            except ValueError:
-                # If MaterialPredefined fails, fall through to user materials
-                pass
-
-        raise ValueError(f"Unknown material '{material_name}'")
+        return _resolve_material(self.registry, material_name)
 
     def apply_selected_material(self):
         """Apply the selected material from the Volume Properties dropdown."""
@@ -1179,11 +1835,20 @@ class GDMLEditorApp:
             messagebox.showwarning("No Material", "Please select a material")
             return
 
+        # Nothing to do: skip marking modified and rewriting the viewer file
+        if getattr(lv.material, 'name', None) == new_material:
+            self.status_var.set(f"{volume_name} already uses {new_material}")
+            return
+
+        material_count = len(self.registry.materialDict)
         try:
             mat = self._ensure_material_in_registry(new_material)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to set material '{new_material}':\n{e}")
             return
+        # The dropdown only changes when a material was created
+        if len(self.registry.materialDict) != material_count:
+            self._update_volume_material_dropdown()
 
         old_material = lv.material.name if hasattr(lv.material, 'name') else str(lv.material)
         try:
@@ -1202,7 +1867,7 @@ class GDMLEditorApp:
                             pass
                 if new_material in getattr(self.registry, 'materialDict', {}):
                     lv.material = self.registry.materialDict[new_material]
-                    self.modified = True
+                    self._mark_modified()
                     self.status_var.set(f"✓ Changed {volume_name}: {old_material} → {new_material} (fallback)")
                 else:
                     raise
@@ -1211,10 +1876,11 @@ class GDMLEditorApp:
                 return
 
         # Update tree row material column
+        self._material_labels[volume_name] = new_material
         if self.volume_tree.exists(volume_name):
             self.volume_tree.item(volume_name, values=(new_material,))
 
-        self.modified = True
+        self._mark_modified()
         self.status_var.set(f"✓ Changed {volume_name}: {old_material} → {new_material}")
         self._update_viewer()
 
@@ -1241,8 +1907,7 @@ class GDMLEditorApp:
         if new_name == old_name:
             return
 
-        world_name = getattr(self.registry.getWorldVolume(), 'name', None) if hasattr(self.registry, 'getWorldVolume') else None
-        if old_name == world_name:
+        if old_name == self._world_name:
             messagebox.showerror("Error", "Renaming the world volume is not supported")
             self.volume_name_var.set(old_name)
             return
@@ -1261,17 +1926,15 @@ class GDMLEditorApp:
         del self.registry.logicalVolumeDict[old_name]
         lv.name = new_name
         self.registry.logicalVolumeDict[new_name] = lv
+        self._volume_renamed(old_name, new_name)
 
-        self.modified = True
+        self._mark_modified()
         self.status_var.set(f"✓ Renamed volume: {old_name} → {new_name}")
 
-        # Refresh UI + select the renamed item
-        self.refresh_volume_tree()
+        # Update the row + select the renamed item
+        self._tree_volume_renamed(old_name, new_name)
         if self.volume_tree.exists(new_name):
-            iid = new_name
-            while iid:
-                self.volume_tree.item(iid, open=True)
-                iid = self.volume_tree.parent(iid)
+            # see() opens the ancestors; the row keeps its own (possibly lazy) state
             self.volume_tree.selection_set(new_name)
             self.volume_tree.see(new_name)
 
@@ -1286,38 +1949,17 @@ class GDMLEditorApp:
         lunit = getattr(solid, 'lunit', None)
         aunit = getattr(solid, 'aunit', None)
 
-        def fmt(name):
-            val = getattr(solid, name, None)
-            if val is None:
-                return None
-            return f"  {name}: {val}"
-
         lines = []
-        if solid_type == 'Box':
-            for k in ('pX', 'pY', 'pZ'):
-                v = fmt(k)
-                if v:
-                    lines.append(v)
-        elif solid_type == 'Tubs':
-            for k in ('pRMin', 'pRMax', 'pDz', 'pSPhi', 'pDPhi'):
-                v = fmt(k)
-                if v:
-                    lines.append(v)
-        elif solid_type == 'Cons':
-            for k in ('pRMin1', 'pRMax1', 'pRMin2', 'pRMax2', 'pDz', 'pSPhi', 'pDPhi'):
-                v = fmt(k)
-                if v:
-                    lines.append(v)
-        elif solid_type == 'Sphere':
-            for k in ('pRMin', 'pRMax', 'pSPhi', 'pDPhi', 'pSTheta', 'pDTheta'):
-                v = fmt(k)
-                if v:
-                    lines.append(v)
-        elif solid_type == 'Torus':
-            for k in ('pRMin', 'pRMax', 'pRTor', 'pSPhi', 'pDPhi'):
-                v = fmt(k)
-                if v:
-                    lines.append(v)
+        fields = _SOLID_FIELDS.get(solid_type)
+        if fields is not None:
+            try:
+                values = _SOLID_GETTERS[solid_type](solid)
+            except AttributeError:
+                # Some pyg4ometry versions lack a field; fetch one by one
+                values = [getattr(solid, name, None) for name in fields]
+            for name, val in zip(fields, values):
+                if val is not None:
+                    lines.append(f"  {name}: {val}")
         elif solid_type == 'TessellatedSolid':
             # Best-effort: not all versions expose facets count.
             for k in ('nFacets', 'numFacets', 'facets'):
@@ -1360,59 +2002,53 @@ class GDMLEditorApp:
         if hasattr(lv, 'material'):
             self.volume_type_label.config(text="Logical Volume")
             mat_name = lv.material.name if hasattr(lv.material, 'name') else str(lv.material)
-            self._update_volume_material_dropdown()
             self.volume_material_var.set(mat_name)
             # Disallow world renaming (keeps registry/world stable)
-            world_name = getattr(self.registry.getWorldVolume(), 'name', None) if hasattr(self.registry, 'getWorldVolume') else None
-            self.rename_button.config(state=tk.DISABLED if volume_name == world_name else tk.NORMAL)
+            self.rename_button.config(state=tk.DISABLED if volume_name == self._world_name else tk.NORMAL)
             self.apply_material_button.config(state=tk.NORMAL)
         else:
             self.volume_type_label.config(text="Assembly Volume")
-            self._update_volume_material_dropdown()
             self.volume_material_var.set("")
-            world_name = getattr(self.registry.getWorldVolume(), 'name', None) if hasattr(self.registry, 'getWorldVolume') else None
-            self.rename_button.config(state=tk.DISABLED if volume_name == world_name else tk.NORMAL)
+            self.rename_button.config(state=tk.DISABLED if volume_name == self._world_name else tk.NORMAL)
             self.apply_material_button.config(state=tk.DISABLED)
         
         # Update info text
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete(1.0, tk.END)
-        
-        info = f"Volume: {volume_name}\n\n"
+        parts = [f"Volume: {volume_name}\n\n"]
         
         if hasattr(lv, 'solid'):
             solid = lv.solid
-            info += f"Solid Type: {type(solid).__name__}\n"
+            parts.append(f"Solid Type: {type(solid).__name__}\n")
             if hasattr(solid, 'name'):
-                info += f"Solid Name: {solid.name}\n"
+                parts.append(f"Solid Name: {solid.name}\n")
 
             params_text = self._format_solid_parameters(solid)
             if params_text:
-                info += "\nSolid Parameters:\n"
-                info += params_text
+                parts.append("\nSolid Parameters:\n")
+                parts.append(params_text)
         
         if hasattr(lv, 'material') and lv.material:
             mat = lv.material
-            info += f"\nMaterial: {mat.name}\n"
+            parts.append(f"\nMaterial: {mat.name}\n")
             if hasattr(mat, 'density'):
-                info += f"Density: {mat.density}\n"
+                parts.append(f"Density: {mat.density}\n")
             if hasattr(mat, 'state'):
-                info += f"State: {mat.state}\n"
+                parts.append(f"State: {mat.state}\n")
         
-        # Placements & daughter count (derived from physicalVolumeDict)
-        placements = []
-        daughter_count = 0
-        for pv_name, pv in getattr(self.registry, 'physicalVolumeDict', {}).items():
-            child_lv = getattr(pv, 'logicalVolume', None)
-            child_name = getattr(child_lv, 'name', None) if child_lv is not None else None
-
-            mother_obj = getattr(pv, 'motherVolume', None) or getattr(pv, 'motherLogicalVolume', None)
-            mother_name = mother_obj if isinstance(mother_obj, str) else getattr(mother_obj, 'name', None)
+        # Placements & daughter count (from the cached placement indices)
+        pvs_by_mother, pvs_by_child = self._pv_indices()
+        daughter_count = len(pvs_by_mother.get(lv.name, ()))
+        placements = pvs_by_child.get(lv.name, ())
 
-            if mother_name == lv.name:
-                daughter_count += 1
-
-            if child_name == lv.name:
+        parts.append(f"\nDaughter volumes: {daughter_count}\n")
+        if placements:
+            parts.append(f"Placements: {len(placements)}\n")
+            # Only the listed placements are evaluated
+            for pv in placements[:10]:
+                mother_obj = getattr(pv, 'motherVolume', None) or getattr(pv, 'motherLogicalVolume', None)
+                mother_name = mother_obj if isinstance(mother_obj, str) else getattr(mother_obj, 'name', None)
+                if mother_name is None:
+                    # Placed only through its mother's daughterVolumes
+                    mother_name = getattr(self._pv_parents.get(id(pv)), 'name', None)
                 try:
                     pos = pv.position.eval() if hasattr(pv, 'position') else None
                 except Exception:
@@ -1421,21 +2057,17 @@ class GDMLEditorApp:
                     rot = pv.rotation.eval() if hasattr(pv, 'rotation') else None
                 except Exception:
                     rot = None
-                placements.append((pv_name, mother_name, pos, rot))
-
-        info += f"\nDaughter volumes: {daughter_count}\n"
-        if placements:
-            info += f"Placements: {len(placements)}\n"
-            for pv_name, mother_name, pos, rot in placements[:10]:
-                info += f"  PV: {pv_name} in {mother_name}\n"
+                parts.append(f"  PV: {pv.name} in {mother_name}\n")
                 if pos is not None:
-                    info += f"    pos(mm): {pos}\n"
+                    parts.append(f"    pos(mm): {pos}\n")
                 if rot is not None:
-                    info += f"    rot(deg): {rot}\n"
+                    parts.append(f"    rot(deg): {rot}\n")
             if len(placements) > 10:
-                info += f"  ... ({len(placements) - 10} more)\n"
+                parts.append(f"  ... ({len(placements) - 10} more)\n")
         
-        self.info_text.insert(1.0, info)
+        # Swap the whole text in one Tcl call; the widget is only writable meanwhile
+        self.info_text.config(state=tk.NORMAL)
+        self.info_text.replace(1.0, tk.END, "".join(parts))
         self.info_text.config(state=tk.DISABLED)
         
     def save_gdml(self):
@@ -1451,7 +2083,7 @@ class GDMLEditorApp:
         filename = filedialog.asksaveasfilename(
             title="Save GDML File As",
             defaultextension=".gdml",
-            filetypes=[("GDML Files", "*.gdml"), ("All Files", "*.*")]
+            filetypes=[("GDML Files", "*.gdml"), ("Compressed GDML", "*.gdml.gz"), ("All Files", "*.*")]
         )
         
         if not filename:
@@ -1477,18 +2109,14 @@ class GDMLEditorApp:
     def save_to_file(self, filename):
         """Save registry to file using pyg4ometry Writer."""
         try:
-            import pyg4ometry.gdml as gdml
-            
             self.status_var.set(f"Saving to {filename}...")
             self.root.update()
             
             # Ensure all element definitions are present before writing
             self._ensure_element_definitions()
             
-            # Use pyg4ometry's GDML writer
-            writer = gdml.Writer()
-            writer.addDetector(self.registry)
-            writer.write(filename)
+            # Use pyg4ometry's GDML writer; user saves are synced to disk
+            _write_gdml(self.registry, filename, fsync=True)
             
             self.modified = False
             self.status_var.set(f"Saved: {Path(filename).name}")
@@ -1503,7 +2131,7 @@ class GDMLEditorApp:
         if not self.registry:
             return
         
-        dialog = InsertVolumeDialog(self.root, self.registry, self.world_lv)
+        dialog = InsertVolumeDialog(self.root, self.registry, self.world_lv, self._sorted_lv_names())
 
         # Wait until the dialog is closed (Insert or Cancel). Without this, `dialog.result`
         # is checked before the user clicks Insert, so the tree/viewer won't refresh.
@@ -1513,20 +2141,15 @@ class GDMLEditorApp:
             pass
 
         if dialog.result:
-            self.refresh_volume_tree()
+            self._volume_added(dialog.result['name'])
+            self._tree_volume_added(dialog.result['name'], dialog.result['parent'])
 
             # Reveal the inserted volume in the hierarchy (expand ancestors, scroll into view).
             inserted_name = dialog.result.get('name')
-            if inserted_name and self.volume_tree.exists(inserted_name):
-                iid = inserted_name
-                while iid:
-                    self.volume_tree.item(iid, open=True)
-                    iid = self.volume_tree.parent(iid)
+            if inserted_name and self._reveal_volume(inserted_name):
                 self.volume_tree.selection_set(inserted_name)
-                self.volume_tree.see(inserted_name)
 
-            self.volume_tree.update_idletasks()
-            self.modified = True
+            self._mark_modified()
             self.status_var.set(f"✓ Inserted volume: {dialog.result['name']}")
             self._update_viewer()
 
@@ -1537,27 +2160,24 @@ class GDMLEditorApp:
         # Check if sys.modules contains cached VtkViewer which might cause issues
         # (similar to the hack at start of file, but good to be safe)
         
-        dialog = InsertGDMLDialog(self.root, self.registry, self.world_lv)
+        dialog = InsertGDMLDialog(self.root, self.registry, self.world_lv, self._sorted_lv_names())
         try:
             self.root.wait_window(dialog.dialog)
         except Exception:
             pass
         
         if dialog.result:
+            self._invalidate_volume_caches()
             self.refresh_volume_tree()
+            # Imported materials join the dropdown
+            self.update_material_list()
             
             # Reveal inserted volume
             iname = dialog.result.get('name')
-            if iname and self.volume_tree.exists(iname):
-                iid = iname
-                while iid:
-                    self.volume_tree.item(iid, open=True)
-                    iid = self.volume_tree.parent(iid)
+            if iname and self._reveal_volume(iname):
                 self.volume_tree.selection_set(iname)
-                self.volume_tree.see(iname)
-                
-            self.volume_tree.update_idletasks()
-            self.modified = True
+
+            self._mark_modified()
             self.status_var.set(f"✓ Inserted GDML volume: {iname}")
             self._update_viewer()
     
@@ -1573,7 +2193,17 @@ class GDMLEditorApp:
 
         selected_iid = selected[0]
         parent_iid = self.volume_tree.parent(selected_iid)
-        volume_name = self.volume_tree.item(selected_iid)['text']
+        # Rows are keyed by LV name
+        volume_name = selected_iid
+        
+        # Validate before asking, so the confirmation is never for a refused delete
+        if volume_name == self._world_name:
+            messagebox.showerror("Cannot Delete", "Cannot delete the world volume.")
+            return
+        lv = self.registry.logicalVolumeDict.get(volume_name)
+        if lv is None:
+            messagebox.showerror("Error", f"Volume '{volume_name}' not found")
+            return
         
         # Confirm deletion
         if not messagebox.askyesno("Confirm Delete", 
@@ -1581,61 +2211,70 @@ class GDMLEditorApp:
                                    "This will remove the logical volume and all its physical volume placements."):
             return
         
-        # Prevent deletion of world volume
-        if volume_name == self.world_lv.name:
-            messagebox.showerror("Cannot Delete", "Cannot delete the world volume.")
-            return
-        
-        try:
-            # Find and remove all physical volumes using this logical volume
-            pv_to_remove = []
-            for lv_name, lv in self.registry.logicalVolumeDict.items():
-                for pv in lv.daughterVolumes:
-                    if pv.logicalVolume.name == volume_name:
-                        pv_to_remove.append((lv, pv))
-            
-            # Remove physical volumes from parent's daughter list and from registry
-            for parent_lv, pv in pv_to_remove:
-                parent_lv.daughterVolumes.remove(pv)
-                # Remove from physicalVolumeDict if it exists
-                if hasattr(pv, 'name') and pv.name in self.registry.physicalVolumeDict:
-                    del self.registry.physicalVolumeDict[pv.name]
-            
-            # Remove from registry
-            if volume_name in self.registry.logicalVolumeDict:
-                lv = self.registry.logicalVolumeDict[volume_name]
-                
-                # Remove all physical volumes that use this logical volume
-                pv_names_to_remove = []
-                for pv_name, pv in self.registry.physicalVolumeDict.items():
-                    if pv.logicalVolume.name == volume_name:
-                        pv_names_to_remove.append(pv_name)
-                for pv_name in pv_names_to_remove:
-                    del self.registry.physicalVolumeDict[pv_name]
-                
-                # Remove solid if it exists
-                if hasattr(lv, 'solid') and lv.solid.name in self.registry.solidDict:
-                    del self.registry.solidDict[lv.solid.name]
-                
-                # Remove logical volume
-                del self.registry.logicalVolumeDict[volume_name]
-            
-            self.refresh_volume_tree()
+        mother_names = self._remove_volume(lv)
+        self._tree_volume_removed(volume_name, mother_names)
 
-            # Keep the UI grounded: after delete, select the previous parent if possible.
-            if parent_iid and self.volume_tree.exists(parent_iid):
-                self.volume_tree.item(parent_iid, open=True)
-                self.volume_tree.selection_set(parent_iid)
-                self.volume_tree.see(parent_iid)
+        # Keep the UI grounded: after delete, select the previous parent if possible.
+        # _reveal_volume already scrolls it into view.
+        if parent_iid and self._reveal_volume(parent_iid):
+            self._expand_tree_item(parent_iid)
+            self.volume_tree.item(parent_iid, open=True)
+            self.volume_tree.selection_set(parent_iid)
 
-            self.modified = True
-            self.status_var.set(f"✓ Deleted volume: {volume_name}")
-            messagebox.showinfo("Success", f"Volume '{volume_name}' has been deleted.")
-            self._update_viewer()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete volume:\n{str(e)}")
+        self._mark_modified()
+        self.status_var.set(f"✓ Deleted volume: {volume_name}")
+        messagebox.showinfo("Success", f"Volume '{volume_name}' has been deleted.")
+        self._update_viewer()
     
+    def _remove_volume(self, lv):
+        """Remove ``lv``, its placements and the placements inside it from the registry.
+
+        The cached indices are updated in place. Returns the names of the
+        mothers that lost a daughter.
+        """
+        volume_name = lv.name
+        # Placements of this logical volume, from the cached indices
+        pvs_by_mother, pvs_by_child = self._pv_indices()
+        pv_parents = self._pv_parents
+        solid_users = self._solid_users
+        pv_dict = self.registry.physicalVolumeDict
+        
+        # Remove them from the registry, grouping them by mother. The index also
+        # holds placements known only to their mother's daughterVolumes; those
+        # must not take out a different pv registered under the same name.
+        doomed_by_mother = {}
+        placements = list(pvs_by_child.get(volume_name, ()))
+        for pv in placements:
+            if pv_dict.get(pv.name) is pv:
+                del pv_dict[pv.name]
+            mother = pv_parents.get(id(pv)) or getattr(pv, 'motherVolume', None)
+            if getattr(mother, 'daughterVolumes', None):
+                doomed_by_mother.setdefault(id(mother), (mother, set()))[1].add(id(pv))
+        
+        # Placements inside the deleted volume go with it
+        inner = list(pvs_by_mother.get(volume_name, ()))
+        for pv in inner:
+            if pv_dict.get(pv.name) is pv:
+                del pv_dict[pv.name]
+        
+        # One pass over each mother's daughter list, deleting from the end so
+        # earlier indices stay valid
+        for mother, doomed in doomed_by_mother.values():
+            daughters = mother.daughterVolumes
+            for idx in reversed([i for i, d in enumerate(daughters) if id(d) in doomed]):
+                del daughters[idx]
+        
+        # Remove its solid, unless another logical volume is built from it too
+        solid = getattr(lv, 'solid', None)
+        if solid is not None and solid_users.get(solid.name, 0) <= 1:
+            self.registry.solidDict.pop(solid.name, None)
+        
+        # Remove logical volume
+        del self.registry.logicalVolumeDict[volume_name]
+        self._index_volume_deleted(lv, placements, inner)
+        self._volume_removed(volume_name)
+        return {m.name for m, _ in doomed_by_mother.values()}
+
     def check_overlaps(self):
         """Check geometry for overlaps using pyg4ometry's mesh-based overlap detection."""
         if not self.registry:
@@ -1666,8 +2305,9 @@ class GDMLEditorApp:
         # Close button
         ttk.Button(progress_window, text="Close", command=progress_window.destroy).pack(pady=10)
         
-        result_text.insert(tk.END, "Initializing overlap check...\\n")
-        result_text.insert(tk.END, "="*60 + "\\n\\n")
+        # Each insert is a Tcl round-trip, so consecutive lines go in one call
+        result_text.insert(tk.END, "Initializing overlap check...\\n"
+                           + "="*60 + "\\n\\n")
         result_text.update()
         
         try:
@@ -1679,71 +2319,69 @@ class GDMLEditorApp:
                 result_text.insert(tk.END, "Error: No world volume found\\n")
                 return
             
-            # Check if geometry contains tessellated solids
+            # Check if geometry contains tessellated solids (explicit stack, so deep
+            # hierarchies can't hit the recursion limit)
             has_tessellated = False
             total_volumes = 0
-            
-            def check_for_tessellated(lv):
-                nonlocal has_tessellated, total_volumes
+            stack = [world_lv]
+            pop, extend = stack.pop, stack.extend
+            while stack:
+                lv = pop()
                 total_volumes += 1
                 if hasattr(lv.solid, 'type') and lv.solid.type == 'TessellatedSolid':
                     has_tessellated = True
-                    return
-                for pv in lv.daughterVolumes:
-                    if hasattr(pv, 'logicalVolume'):
-                        check_for_tessellated(pv.logicalVolume)
+                    continue
+                extend(pv.logicalVolume for pv in lv.daughterVolumes
+                       if hasattr(pv, 'logicalVolume'))
             
-            check_for_tessellated(world_lv)
-            
-            result_text.insert(tk.END, f"World volume: {world_lv.name}\\n")
-            result_text.insert(tk.END, f"Total volumes: {total_volumes}\\n")
-            result_text.insert(tk.END, f"Daughter volumes: {len(world_lv.daughterVolumes)}\\n\\n")
+            result_text.insert(tk.END, f"World volume: {world_lv.name}\\n"
+                               + f"Total volumes: {total_volumes}\\n"
+                               + f"Daughter volumes: {len(world_lv.daughterVolumes)}\\n\\n")
             
             if has_tessellated:
-                result_text.insert(tk.END, "⚠ WARNING: Tessellated Solids Detected\\n")
-                result_text.insert(tk.END, "="*60 + "\\n\\n")
-                result_text.insert(tk.END, "This geometry contains tessellated solids (STL meshes).\\n\\n")
-                result_text.insert(tk.END, "pyg4ometry's mesh-based overlap checking can crash\\n")
-                result_text.insert(tk.END, "on complex tessellated geometries due to CGAL library\\n")
-                result_text.insert(tk.END, "limitations with high polygon counts.\\n\\n")
-                result_text.insert(tk.END, "Recommended alternatives:\\n\\n")
-                result_text.insert(tk.END, "1. Visual inspection:\\n")
-                result_text.insert(tk.END, "   Use the VTK viewer to visually inspect overlaps\\n\\n")
-                result_text.insert(tk.END, "2. Export and check in Geant4:\\n")
-                result_text.insert(tk.END, "   a) Save the GDML file\\n")
-                result_text.insert(tk.END, "   b) Create a Geant4 macro with:\\n")
-                result_text.insert(tk.END, "      /geometry/test/run\\n\\n")
-                result_text.insert(tk.END, "3. Simplify STL meshes:\\n")
-                result_text.insert(tk.END, "   Reduce polygon count before conversion\\n\\n")
+                result_text.insert(tk.END, "⚠ WARNING: Tessellated Solids Detected\\n"
+                                   + "="*60 + "\\n\\n"
+                                   + "This geometry contains tessellated solids (STL meshes).\\n\\n"
+                                   + "pyg4ometry's mesh-based overlap checking can crash\\n"
+                                   + "on complex tessellated geometries due to CGAL library\\n"
+                                   + "limitations with high polygon counts.\\n\\n"
+                                   + "Recommended alternatives:\\n\\n"
+                                   + "1. Visual inspection:\\n"
+                                   + "   Use the VTK viewer to visually inspect overlaps\\n\\n"
+                                   + "2. Export and check in Geant4:\\n"
+                                   + "   a) Save the GDML file\\n"
+                                   + "   b) Create a Geant4 macro with:\\n"
+                                   + "      /geometry/test/run\\n\\n"
+                                   + "3. Simplify STL meshes:\\n"
+                                   + "   Reduce polygon count before conversion\\n\\n")
                 result_text.update()
                 return
             
-            result_text.insert(tk.END, f"Checking {len(world_lv.daughterVolumes)} daughter volumes\\n\\n")
-            result_text.insert(tk.END, "This uses mesh-based overlap detection.\\n")
-            result_text.insert(tk.END, "Checking for:\\n")
-            result_text.insert(tk.END, "  • Daughter-daughter overlaps\\n")
-            result_text.insert(tk.END, "  • Coplanar surface overlaps\\n")
-            result_text.insert(tk.END, "  • Protrusions from mother volume\\n\\n")
+            result_text.insert(tk.END, f"Checking {len(world_lv.daughterVolumes)} daughter volumes\\n\\n"
+                               + "This uses mesh-based overlap detection.\\n"
+                               + "Checking for:\\n"
+                               + "  • Daughter-daughter overlaps\\n"
+                               + "  • Coplanar surface overlaps\\n"
+                               + "  • Protrusions from mother volume\\n\\n")
             result_text.update()
             
             # Counter for overlaps
             n_overlaps = [0]
             
             # Redirect logging to capture overlap messages
-            import logging
             import io
             log_capture = io.StringIO()
             handler = logging.StreamHandler(log_capture)
             handler.setLevel(logging.ERROR)
-            logger = logging.getLogger('pyg4ometry.geant4.LogicalVolume')
-            old_level = logger.level
-            logger.addHandler(handler)
-            logger.setLevel(logging.ERROR)
+            lv_logger = logging.getLogger('pyg4ometry.geant4.LogicalVolume')
+            old_level = lv_logger.level
+            lv_logger.addHandler(handler)
+            lv_logger.setLevel(logging.ERROR)
             
             try:
-                result_text.insert(tk.END, "Running overlap checks (this may take a while)...\\n")
-                result_text.insert(tk.END, "\\nNote: Overlap checking on tessellated/STL geometries\\n")
-                result_text.insert(tk.END, "may be slow or unstable due to mesh complexity.\\n\\n")
+                result_text.insert(tk.END, "Running overlap checks (this may take a while)...\\n"
+                                   + "\\nNote: Overlap checking on tessellated/STL geometries\\n"
+                                   + "may be slow or unstable due to mesh complexity.\\n\\n")
                 result_text.update()
                 
                 try:
@@ -1754,40 +2392,40 @@ class GDMLEditorApp:
                     # Get logged overlap messages
                     log_output = log_capture.getvalue()
                     
-                    result_text.insert(tk.END, "\\n" + "="*60 + "\\n")
-                    result_text.insert(tk.END, "OVERLAP CHECK RESULTS\\n")
-                    result_text.insert(tk.END, "="*60 + "\\n\\n")
+                    result_text.insert(tk.END, "\\n" + "="*60 + "\\n"
+                                       + "OVERLAP CHECK RESULTS\\n"
+                                       + "="*60 + "\\n\\n")
                     
                     if n_overlaps[0] > 0:
                         result_text.insert(tk.END, f"⚠ FOUND {n_overlaps[0]} OVERLAP(S)\\n\\n")
                         if log_output:
-                            result_text.insert(tk.END, "Details:\\n")
-                            result_text.insert(tk.END, "-" * 60 + "\\n")
-                            result_text.insert(tk.END, log_output)
-                        result_text.insert(tk.END, "\\n" + "-" * 60 + "\\n")
-                        result_text.insert(tk.END, "\\nYou can visualize the overlaps by viewing the geometry.\\n")
-                        result_text.insert(tk.END, "Overlaps will be highlighted in the VTK viewer.\\n")
+                            result_text.insert(tk.END, "Details:\\n"
+                                               + "-" * 60 + "\\n"
+                                               + log_output)
+                        result_text.insert(tk.END, "\\n" + "-" * 60 + "\\n"
+                                           + "\\nYou can visualize the overlaps by viewing the geometry.\\n"
+                                           + "Overlaps will be highlighted in the VTK viewer.\\n")
                     else:
-                        result_text.insert(tk.END, "✓ No overlaps detected\\n\\n")
-                        result_text.insert(tk.END, "Geometry appears to be valid!\\n")
+                        result_text.insert(tk.END, "✓ No overlaps detected\\n\\n"
+                                           + "Geometry appears to be valid!\\n")
                         
                 except (MemoryError, SystemError, OSError) as mesh_error:
-                    result_text.insert(tk.END, "\\n" + "="*60 + "\\n")
-                    result_text.insert(tk.END, "⚠ OVERLAP CHECK FAILED\\n")
-                    result_text.insert(tk.END, "="*60 + "\\n\\n")
-                    result_text.insert(tk.END, f"Error: {str(mesh_error)}\\n\\n")
-                    result_text.insert(tk.END, "The mesh-based overlap checking failed, possibly due to:\\n")
-                    result_text.insert(tk.END, "  • Very complex tessellated/STL geometries\\n")
-                    result_text.insert(tk.END, "  • High polygon count meshes\\n")
-                    result_text.insert(tk.END, "  • Memory constraints\\n\\n")
-                    result_text.insert(tk.END, "Consider:\\n")
-                    result_text.insert(tk.END, "  • Simplifying STL meshes before conversion\\n")
-                    result_text.insert(tk.END, "  • Checking overlaps in Geant4 directly\\n")
-                    result_text.insert(tk.END, "  • Using VTK viewer for visual inspection\\n")
+                    result_text.insert(tk.END, "\\n" + "="*60 + "\\n"
+                                       + "⚠ OVERLAP CHECK FAILED\\n"
+                                       + "="*60 + "\\n\\n"
+                                       + f"Error: {str(mesh_error)}\\n\\n"
+                                       + "The mesh-based overlap checking failed, possibly due to:\\n"
+                                       + "  • Very complex tessellated/STL geometries\\n"
+                                       + "  • High polygon count meshes\\n"
+                                       + "  • Memory constraints\\n\\n"
+                                       + "Consider:\\n"
+                                       + "  • Simplifying STL meshes before conversion\\n"
+                                       + "  • Checking overlaps in Geant4 directly\\n"
+                                       + "  • Using VTK viewer for visual inspection\\n")
                 
             finally:
-                logger.removeHandler(handler)
-                logger.setLevel(old_level)
+                lv_logger.removeHandler(handler)
+                lv_logger.setLevel(old_level)
             
             result_text.see(tk.END)
             
@@ -1804,48 +2442,63 @@ class GDMLEditorApp:
         try:
             import tempfile
             import subprocess
-            import pyg4ometry.gdml as gdml
             
             self.status_var.set("Launching VTK viewer...")
             self.root.update()
             
-            # Create or reuse temporary file
+            # Create or reuse temporary file. It is only scratch for the viewer, so
+            # keep it in RAM (tmpfs) where Linux provides one
             if not self.viewer_temp_file:
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.gdml', delete=False) as tmp:
+                shm_dir = '/dev/shm' if sys.platform.startswith('linux') and os.path.isdir('/dev/shm') else None
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.gdml', delete=False, dir=shm_dir) as tmp:
                     self.viewer_temp_file = tmp.name
             
-            # Ensure all element definitions are present before writing
-            self._ensure_element_definitions()
-            
-            # Save current geometry
-            writer = gdml.Writer()
-            writer.addDetector(self.registry)
-            writer.write(self.viewer_temp_file)
+            # Save current geometry; this supersedes any pending auto-refresh write.
+            # Let a queued write finish first; if it (or an earlier one) already
+            # stored this registry state there is nothing to write. Otherwise
+            # wait for a new write, so the viewer starts from a complete file.
+            if self._viewer_after is not None:
+                self.root.after_cancel(self._viewer_after)
+                self._viewer_after = None
+            pending = self._viewer_write
+            written = self._viewer_epoch == self._registry_epoch
+            # exception() waits for the write; a failed one is redone below
+            if pending is not None and pending[1].exception() is None:
+                written = written or pending[0] == self._registry_epoch
+            if not written:
+                self._submit_viewer_write().result()
             
             # Launch viewer as separate process using run_vtkviewer.py
-            viewer_script = Path(__file__).parent / "run_vtkviewer.py"
-            if viewer_script.exists():
+            if _VIEWER_SCRIPT_EXISTS:
                 # Check if viewer is already running
-                if self.viewer_process and self.viewer_process.poll() is None:
+                if self._viewer_running():
                     # Viewer already running, just update the file (auto-refresh will handle it)
                     self.status_var.set("VTK viewer updated (auto-refresh active)")
-                    print("✓ Geometry updated - viewer will auto-refresh")
+                    logger.debug("Geometry updated - viewer will auto-refresh")
                 else:
-                    # Launch new viewer with auto-refresh enabled
+                    # Launch new viewer with auto-refresh enabled. Its per-reload chatter
+                    # only reaches the terminal when debug logging is on, so a slow
+                    # terminal can't stall it; errors on stderr still show.
+                    chatter = None if logger.isEnabledFor(logging.DEBUG) else subprocess.DEVNULL
                     self.viewer_process = subprocess.Popen(
-                        [sys.executable, str(viewer_script), self.viewer_temp_file, "--watch"]
+                        [sys.executable, str(_VIEWER_SCRIPT), self.viewer_temp_file, "--watch"],
+                        stdin=subprocess.DEVNULL, stdout=chatter
                     )
+                    self._watch_viewer_exit()
                     self.status_var.set("VTK viewer launched with auto-refresh")
-                    print("\n" + "="*60)
-                    print("VTK Viewer Controls:")
-                    print("  Rotate:   Left mouse button")
-                    print("  Zoom:     Right mouse button or scroll wheel")
-                    print("  Pan:      Middle mouse button")
-                    print("  Clipping: Click and drag the plane widget")
-                    print("  Toggle Clipping: Press 'c' key")
-                    print("  Quit:     Press 'q' in the viewer window")
-                    print("\n  AUTO-REFRESH: Enabled - viewer updates when you edit geometry")
-                    print("="*60 + "\n")
+                    # The controls don't change between launches: print them once
+                    if not self._viewer_banner_shown:
+                        self._viewer_banner_shown = True
+                        print("\n" + "="*60 + "\n"
+                              + "VTK Viewer Controls:\n"
+                              + "  Rotate:   Left mouse button\n"
+                              + "  Zoom:     Right mouse button or scroll wheel\n"
+                              + "  Pan:      Middle mouse button\n"
+                              + "  Clipping: Click and drag the plane widget\n"
+                              + "  Toggle Clipping: Press 'c' key\n"
+                              + "  Quit:     Press 'q' in the viewer window\n"
+                              + "\n  AUTO-REFRESH: Enabled - viewer updates when you edit geometry\n"
+                              + "="*60 + "\n")
             else:
                 messagebox.showerror("Error", "VTK viewer script (gdml_editor/run_vtkviewer.py) not found")
                 self.status_var.set("Viewer script not found")
@@ -1854,24 +2507,114 @@ class GDMLEditorApp:
             messagebox.showerror("Error", f"Failed to launch VTK viewer:\n{str(e)}")
             self.status_var.set("Error launching viewer")
     
+    def _viewer_running(self):
+        """Return whether the launched VTK viewer process is still alive.
+
+        While a pidfd is registered, :meth:`_on_viewer_exit` clears
+        ``viewer_process`` as soon as the viewer exits, so no syscall is
+        needed here. Otherwise the process is polled.
+        """
+        if self.viewer_process is None:
+            return False
+        if self._viewer_pidfd is not None:
+            return True
+        return self.viewer_process.poll() is None
+
+    def _watch_viewer_exit(self):
+        """Have the Tk event loop report the viewer's exit, where supported.
+
+        Uses ``os.pidfd_open`` (Linux 5.3+, Python 3.9+). Elsewhere, or if
+        the pidfd cannot be opened or registered, :meth:`_viewer_running`
+        falls back to polling the process.
+        """
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return
+        try:
+            fd = pidfd_open(self.viewer_process.pid)
+        except OSError:
+            return
+        try:
+            self.root.tk.createfilehandler(fd, tk.READABLE, self._on_viewer_exit)
+        except (AttributeError, tk.TclError):
+            os.close(fd)
+            return
+        self._viewer_pidfd = fd
+
+    def _on_viewer_exit(self, fd, mask):
+        """Tk file handler: the viewer process behind ``fd`` has exited."""
+        self.root.tk.deletefilehandler(fd)
+        os.close(fd)
+        if fd == self._viewer_pidfd:
+            self._viewer_pidfd = None
+            if self.viewer_process is not None:
+                # Reap the child so it doesn't linger as a zombie
+                self.viewer_process.poll()
+                self.viewer_process = None
+
     def _update_viewer(self):
-        """Update viewer if it's running (for auto-refresh)."""
+        """Schedule a viewer update if it's running (for auto-refresh).
+
+        Edits arriving within 150 ms of each other share one rewrite of the
+        viewer file, done by :meth:`_flush_viewer`.
+        """
+        if self._viewer_after is not None:
+            return
+        self._viewer_after = self.root.after(150, self._flush_viewer)
+
+    def _flush_viewer(self):
+        """Write the current geometry to the viewer file if the viewer is running."""
+        if self._viewer_after is not None:
+            self.root.after_cancel(self._viewer_after)
+            self._viewer_after = None
         if not self.viewer_temp_file or not self.registry:
             return
+        # The file already shows the current geometry, or a write of it is queued
+        if self._viewer_epoch == self._registry_epoch or self._viewer_write_pending():
+            return
         
         # Check if viewer process is still running
-        if self.viewer_process and self.viewer_process.poll() is None:
+        if self._viewer_running():
             try:
-                import pyg4ometry.gdml as gdml
-                # Ensure element definitions exist before writing
-                self._ensure_element_definitions()
-                # Save current geometry to the temp file
-                writer = gdml.Writer()
-                writer.addDetector(self.registry)
-                writer.write(self.viewer_temp_file)
-                print("✓ Viewer updated - auto-refresh active")
+                self._submit_viewer_write()
             except Exception as e:
-                print(f"Warning: Could not update viewer: {e}")
+                logger.warning("Could not update viewer: %s", e)
+
+    def _viewer_write_pending(self):
+        """True while a write of the current registry state is still running."""
+        pending = self._viewer_write
+        return pending is not None and pending[0] == self._registry_epoch and not pending[1].done()
+
+    def _submit_viewer_write(self):
+        """Render the registry and hand the text to the viewer writer thread.
+
+        Rendering walks the live registry, so it stays on the Tk thread; only
+        the file write (and the atomic rename) runs on the worker. Returns the
+        write's future. ``_viewer_epoch`` only advances once the write succeeded,
+        so a failed one is retried by the next flush.
+        """
+        # Ensure element definitions exist before writing
+        self._ensure_element_definitions()
+        text = _render_gdml(self.registry)
+        if self._viewer_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._viewer_executor = ThreadPoolExecutor(max_workers=1)
+        epoch = self._registry_epoch
+        future = self._viewer_executor.submit(_write_gdml_text, text, self.viewer_temp_file)
+        self._viewer_write = (epoch, future)
+        future.add_done_callback(functools.partial(self._viewer_write_done, epoch))
+        return future
+
+    def _viewer_write_done(self, epoch, future):
+        """Done-callback for viewer file writes (runs on the writer thread)."""
+        error = future.exception()
+        if error is not None:
+            logger.warning("Could not update viewer: %s", error)
+            return
+        # The single worker finishes writes in order: this is the file on disk now
+        self._viewer_epoch = epoch
+        logger.debug("Viewer updated - auto-refresh active")
 
 
 def main():
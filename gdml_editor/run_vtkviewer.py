@@ -58,6 +58,9 @@ for mod in modules_to_clear:
 # Ensure DISPLAY is set for X11 (hardware acceleration)
 os.environ["DISPLAY"] = ":0"
 
+# Full edge length (mm) of the world box wrapped around STL/STEP meshes
+WORLD_BOX_SIZE = (5000, 5000, 5000)
+
 
 def load_geometry(file_path, use_flat=False):
     """Load geometry from various formats.
@@ -101,7 +104,7 @@ def load_geometry(file_path, use_flat=False):
         
         # Create world volume to contain the STL mesh
         world_solid = pyg4ometry.geant4.solid.Box(
-            "world_solid", 5000, 5000, 5000, reg, lunit="mm"
+            "world_solid", *WORLD_BOX_SIZE, reg, lunit="mm"
         )
         world_lv = pyg4ometry.geant4.LogicalVolume(
             world_solid, world_material, "world_lv", reg
@@ -176,7 +179,7 @@ def load_geometry(file_path, use_flat=False):
             
             # Create world volume
             world_solid = pyg4ometry.geant4.solid.Box(
-                "world_solid", 5000, 5000, 5000, reg, lunit="mm"
+                "world_solid", *WORLD_BOX_SIZE, reg, lunit="mm"
             )
             world_lv = pyg4ometry.geant4.LogicalVolume(
                 world_solid, world_material, "world_lv", reg
@@ -253,87 +256,17 @@ def change_material(reg, volume_name, material_name):
     
     # Find or create the material
     if material_name not in reg.materialDict:
-        # Try to create as a NIST material
-        try:
-            import pyg4ometry
-            # Use pyg4ometry's NIST material database
-            new_material = pyg4ometry.geant4.nist_material_2geant4Material(
-                material_name, reg
-            )
-            print(f"Created NIST material: {material_name}")
-        except Exception as e:
-            print(f"Error: Material '{material_name}' not found and cannot create as NIST material")
-            print(f"Error details: {e}")
-            print("\nAvailable materials:")
-            for name in reg.materialDict.keys():
-                print(f"  {name}")
-            return False
-    
-    # Change the material
-    old_material = lv.material.name if hasattr(lv.material, 'name') else str(lv.material)
-    lv.material = reg.materialDict[material_name]
-    print(f"✓ Changed material of '{volume_name}' from '{old_material}' to '{material_name}'")
-    return True
-
-
-
-    """List all logical volumes and their materials."""
-    print("\nLogical Volumes:")
-    print("-" * 80)
-    print(f"{'Volume Name':<40} {'Material':<30}")
-    print("-" * 80)
-    for name, lv in reg.logicalVolumeDict.items():
-        if hasattr(lv, 'material'):
-            mat_name = lv.material.name if hasattr(lv.material, 'name') else str(lv.material)
-        else:
-            mat_name = "(Assembly - no material)"
-        print(f"{name:<40} {mat_name:<30}")
-    print("-" * 80)
-
-
-def list_materials(reg):
-    """List all materials in the registry."""
-    print("\nMaterials:")
-    print("-" * 80)
-    for name, mat in reg.materialDict.items():
-        print(f"  {name}")
-    print("-" * 80)
-
-
-def change_material(reg, volume_name, material_name):
-    """Change the material of a logical volume."""
-    # Find the logical volume
-    if volume_name not in reg.logicalVolumeDict:
-        print(f"Error: Volume '{volume_name}' not found")
-        print("\nAvailable volumes:")
-        for name in reg.logicalVolumeDict.keys():
-            print(f"  {name}")
-        return False
-    
-    lv = reg.logicalVolumeDict[volume_name]
-    
-    # Check if it's an assembly (no material)
-    if not hasattr(lv, 'material'):
-        print(f"Error: '{volume_name}' is an assembly volume and has no material")
-        return False
-    
-    # Find or create the material
-    if material_name not in reg.materialDict:
-        # Try to create as a NIST material
-        try:
-            import pyg4ometry
-            # Use pyg4ometry's NIST material database
-            new_material = pyg4ometry.geant4.nist_material_2geant4Material(
-                material_name, reg
-            )
-            print(f"Created NIST material: {material_name}")
-        except Exception as e:
-            print(f"Error: Material '{material_name}' not found and cannot create as NIST material")
-            print(f"Error details: {e}")
+        import pyg4ometry
+        # Check the (cached) NIST table up front instead of probing with try/except
+        if material_name not in pyg4ometry.geant4.getNistMaterialDict():
+            print(f"Error: Material '{material_name}' not found and is not a NIST material")
             print("\nAvailable materials:")
             for name in reg.materialDict.keys():
                 print(f"  {name}")
             return False
+        # Use pyg4ometry's NIST material database
+        pyg4ometry.geant4.nist_material_2geant4Material(material_name, reg)
+        print(f"Created NIST material: {material_name}")
     
     # Change the material
     old_material = lv.material.name if hasattr(lv.material, 'name') else str(lv.material)
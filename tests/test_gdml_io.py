@@ -0,0 +1,102 @@
+"""Tests for writing and reading GDML files."""
+
+import gzip
+import os
+import stat
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import gdml_editor.gui as gui
+
+
+def test_write_gdml_text_replaces_file_and_keeps_mode(tmp_path):
+    """The new text replaces the old file, which keeps its permission bits."""
+    target = tmp_path / "geom.gdml"
+    target.write_text("old")
+    target.chmod(0o640)
+
+    gui._write_gdml_text("<gdml/>", target)
+
+    assert target.read_text() == "<gdml/>"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert not (tmp_path / "geom.gdml.tmp").exists()
+
+
+def test_write_gdml_text_failure_keeps_old_file(tmp_path, monkeypatch):
+    """A failed write removes the temporary file and leaves the old version."""
+    target = tmp_path / "geom.gdml"
+    target.write_text("old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(gui.os, "replace", fail)
+    with pytest.raises(OSError):
+        gui._write_gdml_text("<gdml/>", target, fsync=True)
+
+    assert target.read_text() == "old"
+    assert not (tmp_path / "geom.gdml.tmp").exists()
+
+
+def test_write_gdml_text_gzip(tmp_path):
+    """A ``.gz`` filename is written gzip-compressed."""
+    target = tmp_path / "geom.gdml.gz"
+
+    gui._write_gdml_text("<gdml/>", target, fsync=True)
+
+    with gzip.open(target, "rt", encoding="utf-8") as f:
+        assert f.read() == "<gdml/>"
+    assert os.listdir(tmp_path) == ["geom.gdml.gz"]
+
+
+def _write_box_world(path):
+    g4 = pytest.importorskip("pyg4ometry.geant4")
+    reg = g4.Registry()
+    box = g4.solid.Box("world_box", 100, 100, 100, reg)
+    world = g4.LogicalVolume(box, "G4_AIR", "world", reg)
+    reg.setWorld(world)
+    gui._write_gdml(reg, path)
+
+
+def test_read_gdml_gz_round_trip(tmp_path):
+    """A compressed file reads back, and its unpacked copy is removed."""
+    target = tmp_path / "geom.gdml.gz"
+    _write_box_world(target)
+
+    reg = gui._read_gdml(target)
+
+    assert reg.getWorldVolume().name == "world"
+    assert "world_box" in reg.solidDict
+    assert os.listdir(tmp_path) == ["geom.gdml.gz"]
+
+
+def test_read_gdml_gz_read_only_dir(tmp_path, monkeypatch):
+    """When the source directory is not writable, the default temp dir is used."""
+    import tempfile
+
+    src_dir = tmp_path / "ro"
+    src_dir.mkdir()
+    target = src_dir / "geom.gdml.gz"
+    _write_box_world(target)
+    fallback = tmp_path / "tmp"
+    fallback.mkdir()
+
+    mkstemp = tempfile.mkstemp
+    used = []
+
+    def read_only_mkstemp(suffix=None, prefix=None, dir=None, text=False):
+        # Running as root ignores chmod, so refuse the source dir explicitly
+        if dir is not None and os.path.samefile(dir, src_dir):
+            raise PermissionError(13, "Permission denied", dir)
+        used.append(dir)
+        return mkstemp(suffix=suffix, prefix=prefix, dir=dir or fallback, text=text)
+
+    monkeypatch.setattr(tempfile, "mkstemp", read_only_mkstemp)
+    reg = gui._read_gdml(target)
+
+    assert reg.getWorldVolume().name == "world"
+    assert used == [None]
+    assert os.listdir(src_dir) == ["geom.gdml.gz"]
+    assert os.listdir(fallback) == []
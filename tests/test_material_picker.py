@@ -0,0 +1,20 @@
+"""Tests for the searchable material picker helpers."""
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import gdml_editor.gui as gui
+
+
+def test_match_choices_prefix_then_substring():
+    """Prefix matches are case-insensitive; substrings are a fallback."""
+    index = gui._choice_index(["G4_WATER", "G4_Al", "G4_AIR", "Vacuum"])
+    assert gui._match_choices(index, "g4_a") == ["G4_AIR", "G4_Al"]
+    assert gui._match_choices(index, "water") == ["G4_WATER"]
+    assert gui._match_choices(index, "", limit=2) == ["G4_AIR", "G4_Al"]
+
+
+def test_sorted_case_insensitive():
+    """Names sort ignoring case; equal lowercase names keep a fixed order."""
+    assert gui._sorted_case_insensitive({"beta", "Alpha", "gamma", "Beta"}) == ["Alpha", "Beta", "beta", "gamma"]
@@ -19,3 +19,21 @@ def test_nist_material_list_available():
     """pyg4ometry NIST material list should be available and contain common entries."""
     mats = list(g4.getNistMaterialList())
     assert "G4_AIR" in mats
+
+
+def test_nist_materials_read_once():
+    """The GUI reads the NIST list once and shares it as a tuple."""
+    mats = gui._nist_materials()
+    assert isinstance(mats, tuple)
+    assert "G4_AIR" in mats
+    assert gui._nist_materials() is mats
+
+
+def test_resolve_material():
+    """NIST names are created on demand; unknown names raise ValueError."""
+    reg = g4.Registry()
+    mat = gui._resolve_material(reg, "G4_AIR")
+    assert reg.materialDict["G4_AIR"] is mat
+    assert gui._resolve_material(reg, "G4_AIR") is mat
+    with pytest.raises(ValueError):
+        gui._resolve_material(reg, "G4_NOT_A_MATERIAL")
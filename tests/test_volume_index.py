@@ -0,0 +1,159 @@
+"""Tests for the cached volume hierarchy indices (no display needed)."""
+
+import pytest
+
+pytest.importorskip("tkinter")
+g4 = pytest.importorskip("pyg4ometry.geant4")
+
+import gdml_editor.gui as gui
+
+
+def _make_app(registry):
+    """A GDMLEditorApp with only the registry-side state, no Tk window."""
+    app = gui.GDMLEditorApp.__new__(gui.GDMLEditorApp)
+    app.registry = registry
+    app._lv_names = None
+    app._lv_name_index = None
+    app._children_by_mother = None
+    app._material_labels = {}
+    return app
+
+
+@pytest.fixture
+def geometry():
+    """W holds A and B; A holds B again; B holds C. C and D share a solid."""
+    reg = g4.Registry()
+    lvs = {name: g4.LogicalVolume(g4.solid.Box(f"{name}_box", 10, 10, 10, reg), "G4_AIR", name, reg)
+           for name in "WAB"}
+    shared = g4.solid.Box("shared_box", 1, 1, 1, reg)
+    lvs.update({name: g4.LogicalVolume(shared, "G4_AIR", name, reg) for name in "CD"})
+    reg.setWorld(lvs["W"])
+    pvs = {
+        "A_in_W": g4.PhysicalVolume([0, 0, 0], [0, 0, 0], lvs["A"], "A_in_W", lvs["W"], reg),
+        "B_in_W": g4.PhysicalVolume([0, 0, 0], [5, 0, 0], lvs["B"], "B_in_W", lvs["W"], reg),
+        "B_in_A": g4.PhysicalVolume([0, 0, 0], [0, 0, 0], lvs["B"], "B_in_A", lvs["A"], reg),
+        "C_in_B": g4.PhysicalVolume([0, 0, 0], [0, 0, 0], lvs["C"], "C_in_B", lvs["B"], reg),
+    }
+    return reg, lvs, pvs
+
+
+def _snapshot(app):
+    """The cached indices as plain, comparable values."""
+    def ids(index):
+        return {key: sorted(map(id, pvs)) for key, pvs in index.items() if pvs}
+
+    return (
+        {mother: list(kids) for mother, kids in app._children_by_mother.items() if kids},
+        ids(app._pvs_by_mother),
+        ids(app._pvs_by_child),
+        {pv_id: lv.name for pv_id, lv in app._pv_parents.items()},
+        {name: count for name, count in app._solid_users.items() if count},
+    )
+
+
+def _rebuilt(app):
+    """The indices a full rebuild from the registry would give."""
+    fresh = _make_app(app.registry)
+    fresh._children_map()
+    return _snapshot(fresh)
+
+
+def test_children_map_built_from_registry(geometry):
+    reg, lvs, pvs = geometry
+    app = _make_app(reg)
+
+    assert app._children_map() == {"W": ["A", "B"], "A": ["B"], "B": ["C"]}
+    by_mother, by_child = app._pv_indices()
+    assert [pv.name for pv in by_mother["W"]] == ["A_in_W", "B_in_W"]
+    assert {pv.name for pv in by_child["B"]} == {"B_in_W", "B_in_A"}
+    assert app._pv_parents[id(pvs["B_in_A"])] is lvs["A"]
+    assert app._pv_parents[id(pvs["B_in_W"])] is lvs["W"]
+    assert app._solid_users["shared_box"] == 2
+
+
+def test_index_after_insert(geometry):
+    reg, lvs, _ = geometry
+    app = _make_app(reg)
+    app._children_map()
+
+    new_lv = g4.LogicalVolume(g4.solid.Box("E_box", 1, 1, 1, reg), "G4_AIR", "E", reg)
+    pv = g4.PhysicalVolume([0, 0, 0], [0, 0, 0], new_lv, "E_in_A", lvs["A"], reg)
+    app._volume_added("E")
+
+    assert app._children_map()["A"] == ["B", "E"]
+    assert app._pv_indices()[1]["E"] == [pv]
+    assert app._pv_parents[id(pv)] is lvs["A"]
+    assert app._solid_users["E_box"] == 1
+
+
+def test_index_after_rename(geometry):
+    reg, lvs, pvs = geometry
+    app = _make_app(reg)
+    app._children_map()
+
+    # As rename_selected_volume does it
+    lv = reg.logicalVolumeDict.pop("B")
+    lv.name = "Bee"
+    reg.logicalVolumeDict["Bee"] = lv
+    app._volume_renamed("B", "Bee")
+
+    children = app._children_map()
+    assert children["W"] == ["A", "Bee"]
+    assert children["A"] == ["Bee"]
+    assert children["Bee"] == ["C"] and "B" not in children
+    assert {pv.name for pv in app._pv_indices()[1]["Bee"]} == {"B_in_W", "B_in_A"}
+    assert app._pv_parents[id(pvs["C_in_B"])] is lv
+    assert _snapshot(app) == _rebuilt(app)
+
+
+def test_index_after_delete(geometry):
+    reg, lvs, pvs = geometry
+    app = _make_app(reg)
+    app._children_map()
+
+    assert app._remove_volume(lvs["B"]) == {"W", "A"}
+
+    children = app._children_map()
+    assert app._children_by_mother is children  # updated in place, not rebuilt
+    assert children == {"W": ["A"], "A": []}
+    by_mother, by_child = app._pv_indices()
+    assert "B" not in by_child and "B" not in by_mother
+    assert by_child["C"] == []
+    assert id(pvs["B_in_A"]) not in app._pv_parents
+    assert id(pvs["C_in_B"]) not in app._pv_parents
+    assert sorted(reg.physicalVolumeDict) == ["A_in_W"]
+    assert lvs["A"].daughterVolumes == [] and lvs["W"].daughterVolumes == [pvs["A_in_W"]]
+    assert "B_box" not in reg.solidDict
+    assert _snapshot(app) == _rebuilt(app)
+
+
+def test_delete_keeps_shared_solid(geometry):
+    reg, lvs, _ = geometry
+    app = _make_app(reg)
+    app._children_map()
+
+    app._remove_volume(lvs["C"])
+
+    assert "shared_box" in reg.solidDict
+    assert app._solid_users["shared_box"] == 1
+    assert _snapshot(app) == _rebuilt(app)
+
+
+def test_delete_with_repeated_pv_names():
+    """Placements may share a name across mothers; both are removed."""
+    reg = g4.Registry()
+    lvs = {name: g4.LogicalVolume(g4.solid.Box(f"{name}_box", 10, 10, 10, reg), "G4_AIR", name, reg)
+           for name in "WABC"}
+    reg.setWorld(lvs["W"])
+    g4.PhysicalVolume([0, 0, 0], [0, 0, 0], lvs["A"], "A_in_W", lvs["W"], reg)
+    g4.PhysicalVolume([0, 0, 0], [5, 0, 0], lvs["B"], "B_in_W", lvs["W"], reg)
+    g4.PhysicalVolume([0, 0, 0], [0, 0, 0], lvs["C"], "C_pv", lvs["A"], reg)
+    g4.PhysicalVolume([0, 0, 0], [0, 0, 0], lvs["C"], "C_pv", lvs["B"], reg, addRegistry=False)
+    app = _make_app(reg)
+    app._children_map()
+
+    assert app._remove_volume(lvs["C"]) == {"A", "B"}
+
+    assert lvs["A"].daughterVolumes == [] and lvs["B"].daughterVolumes == []
+    assert "C_pv" not in reg.physicalVolumeDict
+    assert _snapshot(app) == _rebuilt(app)